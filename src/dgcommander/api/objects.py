@@ -9,13 +9,11 @@ from ..common.decorators import api_endpoint, with_timing
 from ..contracts.objects import (
     BulkDeleteRequest,
     BulkDeleteResponse,
-    ObjectItem,
     ObjectListRequest,
-    ObjectListResponse,
     ObjectSortOrder,
 )
 from ..util.errors import APIError, NotFoundError
-from ..util.json import json_response
+from ..util.json import json_response, raw_json_response
 from .dependencies import get_catalog, get_credentials
 from .uploads import _enforce_rate_limit
 
@@ -24,7 +22,7 @@ bp = Blueprint("objects", __name__, url_prefix="/api/objects")
 
 @bp.get("/")
 @require_session_or_env
-@api_endpoint(request_model=ObjectListRequest, response_model=ObjectListResponse, validate_query=True)
+@api_endpoint(request_model=ObjectListRequest, validate_query=True)
 @with_timing("list_objects")
 def list_objects(query: ObjectListRequest):
     """List objects with automatic validation and serialization."""
@@ -60,24 +58,10 @@ def list_objects(query: ObjectListRequest):
     except KeyError:
         raise NotFoundError("bucket", "bucket_not_found")
 
-    # Convert util.types.ObjectItem to contracts.ObjectItem
-    converted_objects = []
-    for util_obj in object_list.objects:
-        contract_obj = ObjectItem(
-            key=util_obj.key,
-            original_bytes=util_obj.original_bytes,
-            stored_bytes=util_obj.stored_bytes,
-            compressed=util_obj.compressed,
-            modified=util_obj.modified,
-        )
-        converted_objects.append(contract_obj)
-
-    return ObjectListResponse(
-        objects=converted_objects,
-        common_prefixes=object_list.common_prefixes,
-        cursor=object_list.cursor,
-        limited=object_list.limited,
-    )
+    # util.types.ObjectItem mirrors contracts.ObjectItem field-for-field, so the listing is
+    # encoded straight to the ObjectListResponse JSON shape without per-item model objects;
+    # tests validate the bytes against that contract.
+    return raw_json_response(object_list.to_json_bytes())
 
 
 @bp.get("/<bucket>/<path:key>/metadata")
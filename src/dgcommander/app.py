@@ -27,6 +27,7 @@ from .deps import (
 from .jobs.purge_scheduler import PurgeScheduler
 from .services.deltaglider import DeltaGliderSDK
 from .util.errors import register_error_handlers
+from .util.json import OrjsonProvider
 
 
 def create_app(
@@ -39,6 +40,7 @@ def create_app(
         "dgcommander",
         static_folder=None,  # Disable automatic static file handling
     )
+    app.json = OrjsonProvider(app)
 
     _configure_logging(app)
     _log_and_sanitize_environment()
@@ -61,7 +61,7 @@ class FileSystemSessionStore(BaseSessionStore):
 
         self._lock_file = self._session_dir / ".lock"
         self._index_file = self._session_dir / ".index"
-        self._local_lock = threading.RLock()
+        self._local_lock = threading.Lock()
 
         if sdk_factory is None:
             from dgcommander.auth.credentials import create_sdk_from_credentials
@@ -116,8 +116,8 @@ class FileSystemSessionStore(BaseSessionStore):
         """Get path to session file."""
         return self._session_dir / f"{session_id}.session"
 
-    def _load_session(self, session_id: str) -> SessionData | None:
-        """Load session data from filesystem and reconstruct SDK client."""
+    def _read_file_data(self, session_id: str) -> FileSessionData | None:
+        """Unpickle the stored session record without reconstructing its SDK client."""
         session_file = self._session_file(session_id)
 
         if not session_file.exists():
@@ -125,23 +125,33 @@ class FileSystemSessionStore(BaseSessionStore):
 
         try:
             with open(session_file, "rb") as f:
-                file_data: FileSessionData = pickle.load(f)  # noqa: S301 - Loading trusted session data from our own files
+                return pickle.load(f)  # noqa: S301 - Loading trusted session data from our own files
+        except Exception:
+            # Corrupted file, remove it
+            session_file.unlink(missing_ok=True)
+            return None
+
+    def _load_session(self, session_id: str) -> SessionData | None:
+        """Load session data from filesystem and reconstruct SDK client."""
+        file_data = self._read_file_data(session_id)
+        if file_data is None:
+            return None
 
+        try:
             # Reconstruct SDK client from credentials
             sdk_client = self._sdk_factory(file_data.credentials)
-
-            # Return full SessionData with SDK client
-            return SessionData(
-                credentials=file_data.credentials,
-                sdk_client=sdk_client,
-                last_accessed=file_data.last_accessed,
-                created_at=file_data.created_at,
-            )
         except Exception:
-            # Corrupted file, remove it
-            session_file.unlink(missing_ok=True)
+            self._session_file(session_id).unlink(missing_ok=True)
             return None
 
+        # Return full SessionData with SDK client
+        return SessionData(
+            credentials=file_data.credentials,
+            sdk_client=sdk_client,
+            last_accessed=file_data.last_accessed,
+            created_at=file_data.created_at,
+        )
+
     def _save_session(self, session_id: str, session_data: SessionData) -> None:
         """Save session data to filesystem (without SDK client)."""
         session_file = self._session_file(session_id)
@@ -168,6 +178,12 @@ class FileSystemSessionStore(BaseSessionStore):
         access_order.append(session_id)
         return access_order
 
+    def _write_access(self, session_id: str, access_order: list[str], *, dirty: bool = False) -> None:
+        """Mark ``session_id`` most recently used, rewriting the index only if the order changes."""
+        if not dirty and access_order and access_order[-1] == session_id:
+            return
+        self._write_index(self._update_access_order(session_id, access_order))
+
     def _evict_lru(self, access_order: list[str]) -> list[str]:
         """Evict least recently used session."""
         if not access_order:
@@ -190,17 +206,18 @@ class FileSystemSessionStore(BaseSessionStore):
         Returns:
             Tuple of (session_id if found, updated access_order)
         """
-        # Check all sessions for matching credentials
+        # Check all sessions for matching credentials. Only the pickled records are read;
+        # building an SDK client per candidate is left to the caller for the single match.
         for session_id in list(access_order):
-            session_data = self._load_session(session_id)
+            file_data = self._read_file_data(session_id)
 
-            if session_data is None:
+            if file_data is None:
                 # File missing, remove from index
                 access_order.remove(session_id)
                 continue
 
-            if self._hash_credentials(session_data.credentials) == cred_hash:
-                if not self._is_expired(session_data):
+            if self._hash_credentials(file_data.credentials) == cred_hash:
+                if not self._is_idle_since(file_data.last_accessed):
                     return session_id, access_order
                 else:
                     # Clean up expired session
@@ -223,8 +240,11 @@ class FileSystemSessionStore(BaseSessionStore):
             lock_fd = self._acquire_file_lock()
             try:
                 access_order = self._read_index()
+                indexed = len(access_order)
                 session_id, access_order = self._find_by_credentials_hash_unlocked(cred_hash, access_order)
-                self._write_index(access_order)
+                # Only stale entries are ever dropped here; skip the rewrite when there were none.
+                if len(access_order) != indexed:
+                    self._write_index(access_order)
                 return session_id
             finally:
                 self._release_file_lock(lock_fd)
@@ -246,6 +266,7 @@ class FileSystemSessionStore(BaseSessionStore):
                 # Check for existing session with same credentials
                 cred_hash = self._hash_credentials(credentials)
                 access_order = self._read_index()
+                indexed = len(access_order)
 
                 # Use unlocked version to avoid deadlock
                 existing_id, access_order = self._find_by_credentials_hash_unlocked(cred_hash, access_order)
@@ -256,9 +277,11 @@ class FileSystemSessionStore(BaseSessionStore):
                     if session_data:
                         self._touch(session_data)
                         self._save_session(existing_id, session_data)
-                        access_order = self._update_access_order(existing_id, access_order)
-                        self._write_index(access_order)
+                        self._write_access(existing_id, access_order, dirty=len(access_order) != indexed)
                         return existing_id, session_data
+                    # The SDK could not be rebuilt and the file is gone; drop the dead id so
+                    # it neither stays in the index nor counts towards max_size.
+                    access_order.remove(existing_id)
 
                 # Create new session
                 session_id = secrets.token_urlsafe(32)
@@ -314,9 +337,7 @@ class FileSystemSessionStore(BaseSessionStore):
                 self._touch(session_data)
                 self._save_session(session_id, session_data)
 
-                access_order = self._read_index()
-                access_order = self._update_access_order(session_id, access_order)
-                self._write_index(access_order)
+                self._write_access(session_id, self._read_index())
 
                 return session_data
             finally:
@@ -355,9 +376,9 @@ class FileSystemSessionStore(BaseSessionStore):
                 expired_count = 0
 
                 for session_id in list(access_order):
-                    session_data = self._load_session(session_id)
+                    file_data = self._read_file_data(session_id)
 
-                    if session_data is None or self._is_expired(session_data):
+                    if file_data is None or self._is_idle_since(file_data.last_accessed):
                         self._delete_session_file(session_id)
                         access_order.remove(session_id)
                         expired_count += 1
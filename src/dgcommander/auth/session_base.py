@@ -34,7 +34,10 @@ class BaseSessionStore:
         return hashlib.sha256(cred_str.encode()).hexdigest()
 
     def _is_expired(self, session_data: SessionData) -> bool:
-        return (time.time() - session_data.last_accessed) > self._ttl
+        return self._is_idle_since(session_data.last_accessed)
+
+    def _is_idle_since(self, last_accessed: float) -> bool:
+        return (time.time() - last_accessed) > self._ttl
 
     def _touch(self, session_data: SessionData) -> None:
         session_data.last_accessed = time.time()
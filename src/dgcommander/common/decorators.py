@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import functools
+import logging
 import time
 from collections.abc import Callable
 from typing import TypeVar
 
-from flask import jsonify, request
+from flask import Response, jsonify, request
 from pydantic import BaseModel, ValidationError
 
 from ..contracts.base import ErrorDetail, ErrorResponse
 from ..util.errors import APIError, NotFoundError
+from ..util.json import json_response
 
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
 
 def api_endpoint(
     request_model: type[BaseModel] | None = None,
@@ -55,8 +59,8 @@ def api_endpoint(
                 # Execute endpoint function
                 result = func(*args, **kwargs)
 
-                # Serialize response
-                if response_model and result is not None:
+                # Serialize response; pre-encoded responses pass through untouched
+                if response_model and result is not None and not isinstance(result, Response):
                     if isinstance(result, dict):
                         response_obj = response_model(**result)
                     elif hasattr(result, "__dict__"):
@@ -64,17 +68,7 @@ def api_endpoint(
                     else:
                         response_obj = result
 
-                    dumped = response_obj.model_dump(mode="json")
-
-                    import json
-
-                    from flask import make_response
-
-                    json_data = json.dumps(dumped, ensure_ascii=False)
-                    response = make_response(json_data, 200)
-                    response.headers["Content-Type"] = "application/json; charset=utf-8"
-                    response.headers["Content-Length"] = str(len(json_data.encode("utf-8")))
-                    return response
+                    return json_response(response_obj.model_dump(mode="json"))
 
                 return result
 
@@ -132,16 +126,14 @@ def with_timing(metric_name: str):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Monotonic clock: durations are unaffected by wall-clock adjustments.
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.debug(f"[METRIC] {metric_name}: {duration:.3f}s")
+                duration = time.perf_counter() - start_time
+                logger.debug("[METRIC] %s: %.3fs", metric_name, duration)
 
         return wrapper
 
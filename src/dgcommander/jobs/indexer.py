@@ -16,6 +16,9 @@ class SavingsJobRunner:
         self._sdk = sdk
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._jobs: dict[str, Future[str]] = {}
+        # Copy-on-write snapshot of buckets with a job in flight. Writers swap in a new
+        # frozenset under the lock; readers check membership without locking.
+        self._pending: frozenset[str] = frozenset()
         self._lock = threading.RLock()
 
     def enqueue(self, bucket: str, sdk: DeltaGliderSDK | None = None) -> str:
@@ -39,8 +42,10 @@ class SavingsJobRunner:
 
             future: Future[str] = self._executor.submit(self._run_job, bucket, task_id, effective_sdk)
             future.job_id = task_id
-            future.add_done_callback(lambda f, b=bucket: self._finalize(b))
             self._jobs[bucket] = future
+            self._pending = self._pending | {bucket}
+            # Registered last: a job that already finished runs _finalize immediately.
+            future.add_done_callback(lambda f, b=bucket: self._finalize(b))
 
             logger.info(f"[ENQUEUE] Job submitted with task_id: {task_id}")
             return task_id
@@ -50,6 +55,7 @@ class SavingsJobRunner:
             future = self._jobs.get(bucket)
             if future and future.done():
                 self._jobs.pop(bucket, None)
+                self._pending = self._pending - {bucket}
 
     def _run_job(self, bucket: str, task_id: str, sdk: DeltaGliderSDK) -> str:
         import logging
@@ -101,6 +107,9 @@ class SavingsJobRunner:
             raise
 
     def pending(self, bucket: str) -> bool:
-        with self._lock:
-            future = self._jobs.get(bucket)
-            return bool(future and not future.done())
+        # Lock-free: the snapshot swap is atomic. A bucket still in the snapshot is confirmed
+        # against its future, since done callbacks run just after result() unblocks waiters.
+        if bucket not in self._pending:
+            return False
+        future = self._jobs.get(bucket)
+        return bool(future and not future.done())
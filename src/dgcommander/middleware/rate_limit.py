@@ -17,7 +17,7 @@ class FixedWindowRateLimiter:
         self._hits: dict[str, deque[float]] = defaultdict(deque)
 
     def check(self, key: str) -> None:
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_seconds
         bucket = self._hits[key]
         while bucket and bucket[0] < window_start:
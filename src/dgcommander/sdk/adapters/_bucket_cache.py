@@ -10,6 +10,12 @@ from ..models import BucketSnapshot
 
 # Default TTL: 5 minutes
 DEFAULT_TTL_SECONDS = 300
+# Bucket names go stale faster than stats: buckets can be deleted by other clients
+DEFAULT_NAMES_TTL_SECONDS = 30
+# Misses are kept only briefly so a bucket created elsewhere shows up quickly
+DEFAULT_MISSING_TTL_SECONDS = 5
+# Upper bound on remembered misses; requests for made-up names must not grow memory
+MAX_MISSING_NAMES = 256
 
 
 class BucketStatsCache:
@@ -19,7 +25,7 @@ class BucketStatsCache:
         self._snapshots: dict[str, BucketSnapshot] = {}
         self._timestamps: dict[str, float] = {}
         self._ttl_seconds = ttl_seconds
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
     def _is_expired(self, name: str) -> bool:
         ts = self._timestamps.get(name)
@@ -68,4 +74,88 @@ class BucketStatsCache:
             self._timestamps.clear()
 
 
-__all__ = ["BucketStatsCache"]
+class BucketNameCache:
+    """Snapshot of the bucket names last returned by ListBuckets, with TTL expiry.
+
+    Positive answers are served from the snapshot. Names S3 reported as missing
+    are remembered separately for a much shorter TTL, so repeated requests for
+    an unknown bucket don't each cost a ListBuckets call while buckets created
+    by other clients still appear within seconds.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_NAMES_TTL_SECONDS,
+        missing_ttl_seconds: float = DEFAULT_MISSING_TTL_SECONDS,
+    ) -> None:
+        self._names: frozenset[str] = frozenset()
+        self._timestamp: float | None = None
+        self._ttl_seconds = ttl_seconds
+        self._missing: dict[str, float] = {}
+        self._missing_ttl_seconds = missing_ttl_seconds
+        self._lock = threading.Lock()
+
+    def replace(self, names: Iterable[str]) -> None:
+        """Store the full set of bucket names from a fresh listing."""
+
+        names = frozenset(names)
+        with self._lock:
+            self._names = names
+            self._timestamp = time.monotonic()
+
+    def add(self, name: str) -> None:
+        """Record a bucket created through this client."""
+
+        with self._lock:
+            self._missing.pop(name, None)
+            if self._timestamp is not None:
+                self._names = self._names | {name}
+
+    def discard(self, name: str) -> None:
+        """Forget a bucket deleted through this client."""
+
+        with self._lock:
+            self._names = self._names - {name}
+            self._record_missing(name)
+
+    def contains(self, name: str) -> bool:
+        """Return True if the bucket was listed recently; False means unknown."""
+
+        with self._lock:
+            if self._timestamp is None or (time.monotonic() - self._timestamp) > self._ttl_seconds:
+                return False
+            return name in self._names
+
+    def mark_missing(self, name: str) -> None:
+        """Remember that S3 just reported the bucket as absent."""
+
+        with self._lock:
+            self._record_missing(name)
+
+    def is_missing(self, name: str) -> bool:
+        """Return True if the bucket was reported absent within the miss TTL."""
+
+        with self._lock:
+            ts = self._missing.get(name)
+            if ts is None:
+                return False
+            if (time.monotonic() - ts) > self._missing_ttl_seconds:
+                del self._missing[name]
+                return False
+            return True
+
+    def _record_missing(self, name: str) -> None:
+        if len(self._missing) >= MAX_MISSING_NAMES:
+            self._missing.clear()
+        self._missing[name] = time.monotonic()
+
+    def clear(self) -> None:
+        """Drop the snapshot so the next lookup goes to S3."""
+
+        with self._lock:
+            self._names = frozenset()
+            self._timestamp = None
+            self._missing.clear()
+
+
+__all__ = ["BucketNameCache", "BucketStatsCache"]
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Hashable
 from dataclasses import dataclass
 from typing import Any
 
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +35,43 @@ class DeltaMetadataResolver:
     back gracefully. Other ``ClientError`` instances are logged and ignored.
     Any unexpected exception from the underlying S3 client is propagated so
     the caller can decide how to surface the failure.
+
+    Resolutions that found the ``.delta`` object are cached per ``(bucket, key)``
+    for ``ttl_seconds`` so repeated listings do not re-issue the same HEAD probes.
+    Objects may be rewritten at any moment by another session's adapter, whose
+    :meth:`invalidate_bucket` call never reaches this resolver. Callers therefore pass
+    the listing entry's ``version`` (its size and last-modified time), which is part of
+    the cache key, so a rewritten object misses. Misses and fallbacks to the plain key
+    are not cached: the delta object may appear without the listed entry changing.
     """
 
-    def __init__(self, s3_client: Any) -> None:
+    def __init__(self, s3_client: Any, *, ttl_seconds: float = 60.0, max_entries: int = 4096) -> None:
         self._s3_client = s3_client
+        self._cache: TTLCache[tuple[str, str, Hashable], DeltaMetadata] = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._lock = threading.Lock()
 
-    def resolve(self, bucket: str, display_key: str) -> DeltaMetadata:
+    def resolve(self, bucket: str, display_key: str, version: Hashable = None) -> DeltaMetadata:
         normalized_display = display_key.lstrip("/")
+        cache_key = (bucket, normalized_display, version)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        resolved = self._probe(bucket, normalized_display)
+        if resolved.physical_key is not None and resolved.physical_key.endswith(".delta"):
+            with self._lock:
+                self._cache[cache_key] = resolved
+        return resolved
+
+    def invalidate_bucket(self, bucket: str) -> None:
+        """Drop cached resolutions for ``bucket``."""
+
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == bucket]:
+                self._cache.pop(key, None)
+
+    def _probe(self, bucket: str, normalized_display: str) -> DeltaMetadata:
 
         candidates: list[str] = []
         if not normalized_display.endswith(".delta"):
@@ -52,13 +52,11 @@ class InMemoryDeltaGliderSDK(BaseDeltaGliderAdapter):
         objects = self._objects.get(bucket)
         if objects is None:
             raise KeyError(normalized)
-        for idx, obj in enumerate(list(objects)):
+        for idx, obj in enumerate(objects):
             if obj.key == normalized:
-                objects.pop(idx)
+                del objects[idx]
                 self._blobs.pop((bucket, obj.physical_key), None)
-                for blob_key in list(self._blobs.keys()):
-                    if blob_key[0] == bucket and blob_key[1] == normalized:
-                        self._blobs.pop(blob_key, None)
+                self._blobs.pop((bucket, normalized), None)
                 self._update_bucket_snapshot(bucket)
                 return
         raise KeyError(normalized)
@@ -104,33 +102,26 @@ class InMemoryDeltaGliderSDK(BaseDeltaGliderAdapter):
         now = datetime.now(UTC)
         physical_key = normalized
 
+        logical = LogicalObject(
+            key=normalized,
+            original_bytes=original_bytes,
+            stored_bytes=stored_bytes,
+            compressed=False,
+            modified=now,
+            physical_key=physical_key,
+        )
         bucket_objects = self._objects.setdefault(bucket, [])
         for index, existing in enumerate(bucket_objects):
             if existing.key == normalized:
-                bucket_objects[index] = LogicalObject(
-                    key=normalized,
-                    original_bytes=original_bytes,
-                    stored_bytes=stored_bytes,
-                    compressed=False,
-                    modified=now,
-                    physical_key=physical_key,
-                )
+                bucket_objects[index] = logical
                 break
         else:
-            bucket_objects.append(
-                LogicalObject(
-                    key=normalized,
-                    original_bytes=original_bytes,
-                    stored_bytes=stored_bytes,
-                    compressed=False,
-                    modified=now,
-                    physical_key=physical_key,
-                )
-            )
+            bucket_objects.append(logical)
 
         self._blobs[(bucket, physical_key)] = data
 
-        self._update_bucket_snapshot(bucket)
+        # The snapshot is stamped with the upload's own timestamp
+        self._update_bucket_snapshot(bucket, computed_at=now)
 
         summary = UploadSummary(
             bucket=bucket,
@@ -221,9 +212,9 @@ class InMemoryDeltaGliderSDK(BaseDeltaGliderAdapter):
         except KeyError as exc:
             raise FileNotFoundError(key) from exc
 
-    def _update_bucket_snapshot(self, bucket: str) -> None:
+    def _update_bucket_snapshot(self, bucket: str, computed_at: datetime | None = None) -> None:
         objects = self._objects.get(bucket, [])
-        snapshot = self._build_snapshot(bucket, objects, computed_at=datetime.now(UTC))
+        snapshot = self._build_snapshot(bucket, objects, computed_at=computed_at)
         for idx, existing in enumerate(self._buckets):
             if existing.name == bucket:
                 self._buckets[idx] = snapshot
@@ -7,14 +7,19 @@ import logging
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, BinaryIO
 
 from ..models import BucketSnapshot, FileMetadata, LogicalObject, ObjectListing, StatsMode, UploadSummary
-from ._bucket_cache import BucketStatsCache
+from ._bucket_cache import BucketNameCache, BucketStatsCache
 from ._compression import compute_compression_stats
 from ._delta_metadata import DeltaMetadataResolver
 from .base import BaseDeltaGliderAdapter
 
+# Per-object metadata keys the deltaglider client attaches to list_objects entries.
+_META_IS_DELTA = "deltaglider-is-delta"
+_META_ORIGINAL_SIZE = "deltaglider-original-size"
+
 
 @dataclass(slots=True)
 class S3Settings:
@@ -60,6 +65,7 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
         self._settings = settings
         self._region = settings.region_name or "eu-west-1"
         self._bucket_cache = BucketStatsCache()
+        self._bucket_names = BucketNameCache()
 
         # Create boto3 S3 client with explicit credentials for bucket operations
         # that are not yet fully abstracted by deltaglider
@@ -105,6 +111,7 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
 
         response = self._boto3_client.list_buckets()
         bucket_names = [bucket["Name"] for bucket in response.get("Buckets", [])]
+        self._bucket_names.replace(bucket_names)
 
         # Drop cache entries for buckets that are gone
         self._bucket_cache.drop_missing(bucket_names)
@@ -131,29 +138,42 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
             self._client.create_bucket(Bucket=name, CreateBucketConfiguration={"LocationConstraint": region})
         else:
             self._client.create_bucket(Bucket=name)
+        self._bucket_names.add(name)
         self._update_cache(self._placeholder_snapshot(name))
 
     def delete_bucket(self, name: str) -> None:
         # Use deltaglider client's delete_bucket method
         self._client.delete_bucket(Bucket=name)
+        self._bucket_names.discard(name)
         self._bucket_cache.remove(name)
 
     def compute_bucket_stats(self, name: str, mode: StatsMode = StatsMode.detailed) -> BucketSnapshot:
         response = self._boto3_client.list_buckets()
         bucket_names = [bucket["Name"] for bucket in response.get("Buckets", [])]
+        self._bucket_names.replace(bucket_names)
         if name not in bucket_names:
             raise ValueError(f"Bucket {name} not found")
         return self._refresh_bucket_stats(name, mode)
 
     def bucket_exists(self, name: str) -> bool:
         """Check if a bucket exists without listing all objects."""
+        # Every object listing checks its bucket first; answer hits from the recent
+        # ListBuckets snapshot and only go back to S3 for names we have not seen.
+        if self._bucket_names.contains(name):
+            return True
+        if self._bucket_names.is_missing(name):
+            return False
         try:
             # Check if bucket is in the list of buckets
             response = self._client.list_buckets()
             bucket_names = [b["Name"] for b in response.get("Buckets", [])]
-            return name in bucket_names
         except Exception:
             return False
+        self._bucket_names.replace(bucket_names)
+        if name not in bucket_names:
+            self._bucket_names.mark_missing(name)
+            return False
+        return True
 
     def list_objects(
         self, bucket: str, prefix: str, max_items: int | None = None, quick_mode: bool = False
@@ -423,9 +443,11 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
 
     def invalidate_bucket_cache(self, bucket: str) -> None:
         self._bucket_cache.remove(bucket)
+        self._delta_resolver.invalidate_bucket(bucket)
 
     def clear_bucket_cache(self) -> None:
         self._bucket_cache.clear()
+        self._bucket_names.clear()
 
     def _update_cache(self, snapshot: BucketSnapshot) -> None:
         self._bucket_cache.put(snapshot)
@@ -485,8 +507,8 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
         normalized_prefix: str,
         quick_mode: bool,
     ) -> None:
-        for item in response.get("Contents", []):
-            objects.append(self._logical_object_from_listing(bucket, item, quick_mode))
+        to_logical = self._logical_object_from_listing
+        objects.extend([to_logical(bucket, item, quick_mode) for item in response.get("Contents", [])])
 
         for p in response.get("CommonPrefixes", []):
             prefix_val = p["Prefix"]
@@ -507,9 +529,13 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
         if isinstance(item, dict):
             display_key = item["Key"]
             stored_size = int(item.get("Size", 0))
-            metadata = item.get("Metadata", {}) or {}
-            is_delta = metadata.get("deltaglider-is-delta", "false").lower() == "true"
-            original_size = self._safe_int(metadata.get("deltaglider-original-size")) or stored_size
+            metadata = item.get("Metadata") or {}
+            # The client writes lowercase flags, so exact matches skip the lower() allocation.
+            delta_flag = metadata.get(_META_IS_DELTA)
+            is_delta = delta_flag == "true" or (
+                delta_flag is not None and delta_flag != "false" and delta_flag.lower() == "true"
+            )
+            original_size = self._safe_int(metadata.get(_META_ORIGINAL_SIZE)) or stored_size
             modified = self._ensure_datetime(item.get("LastModified"))
             physical_key_hint = display_key
             if is_delta and not display_key.endswith(".delta"):
@@ -527,19 +553,19 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
                 display_key = original_key
             physical_key_hint = original_key
 
+        # For direct objects the hint is the display key itself
         physical_key = self._normalize_key(physical_key_hint)
 
         if is_delta:
             if not quick_mode and original_size <= stored_size:
-                resolved = self._delta_resolver.resolve(bucket, display_key)
+                # A rewrite changes the listed size or timestamp, so it never hits a stale entry.
+                resolved = self._delta_resolver.resolve(bucket, display_key, version=(stored_size, modified))
                 if resolved.physical_key:
                     physical_key = self._normalize_key(resolved.physical_key)
                 if resolved.original_bytes is not None:
                     original_size = resolved.original_bytes
                 if resolved.stored_bytes is not None:
                     stored_size = resolved.stored_bytes
-        else:
-            physical_key = self._normalize_key(display_key)
 
         return LogicalObject(
             key=display_key,
@@ -566,11 +592,18 @@ class S3DeltaGliderSDK(BaseDeltaGliderAdapter):
                 return value.replace(tzinfo=UTC)
             return value.astimezone(UTC)
         if isinstance(value, str):
-            parsed = datetime.fromisoformat(value)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=UTC)
-            return parsed.astimezone(UTC)
+            return _parse_timestamp(value)
         return datetime.now(UTC)
 
 
+@lru_cache(maxsize=8192)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp to UTC; objects uploaded together share LastModified strings."""
+
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
 __all__ = ["S3DeltaGliderSDK", "S3Settings"]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import BinaryIO
+from operator import attrgetter
+from typing import Any, BinaryIO
 
 from botocore.exceptions import ClientError
 
@@ -68,8 +71,33 @@ def _build_bucket_stats(
     )
 
 
+# Sort order -> (C-level key getter, reverse); attrgetter avoids a Python frame per comparison key.
+_SORT_KEYS: dict[ObjectSortOrder, tuple[Callable[[LogicalObject], Any], bool]] = {
+    ObjectSortOrder.name_asc: (attrgetter("key"), False),
+    ObjectSortOrder.name_desc: (attrgetter("key"), True),
+    ObjectSortOrder.size_asc: (attrgetter("original_bytes"), False),
+    ObjectSortOrder.size_desc: (attrgetter("original_bytes"), True),
+    ObjectSortOrder.modified_asc: (attrgetter("modified"), False),
+    ObjectSortOrder.modified_desc: (attrgetter("modified"), True),
+}
+
+
+def _filter_objects(
+    objects: Sequence[LogicalObject],
+    compressed: bool | None,
+    search_key: str | None,
+) -> list[LogicalObject]:
+    if compressed is None and not search_key:
+        return list(objects)
+    return [
+        obj
+        for obj in objects
+        if (compressed is None or obj.compressed == compressed) and (not search_key or search_key in obj.key.lower())
+    ]
+
+
 def _filter_and_sort(
-    objects: list[LogicalObject],
+    objects: Sequence[LogicalObject],
     sort_order: ObjectSortOrder,
     compressed: bool | None,
     search_key: str | None,
@@ -78,27 +106,35 @@ def _filter_and_sort(
 
     Builds one filtered list, then sorts it in-place to avoid extra copies.
     """
-    if compressed is None and not search_key:
-        filtered = list(objects)
-    else:
-        filtered = [
-            obj
-            for obj in objects
-            if (compressed is None or obj.compressed == compressed)
-            and (not search_key or search_key in obj.key.lower())
-        ]
-
-    reverse = sort_order in {ObjectSortOrder.modified_desc, ObjectSortOrder.name_desc, ObjectSortOrder.size_desc}
-    if sort_order in {ObjectSortOrder.name_asc, ObjectSortOrder.name_desc}:
-        filtered.sort(key=lambda obj: obj.key, reverse=reverse)
-    elif sort_order in {ObjectSortOrder.size_asc, ObjectSortOrder.size_desc}:
-        filtered.sort(key=lambda obj: obj.original_bytes, reverse=reverse)
-    else:
-        filtered.sort(key=lambda obj: obj.modified, reverse=reverse)
-
+    filtered = _filter_objects(objects, compressed, search_key)
+    sort_key, reverse = _SORT_KEYS[sort_order]
+    filtered.sort(key=sort_key, reverse=reverse)
     return filtered
 
 
+def _filter_and_select(
+    objects: Sequence[LogicalObject],
+    sort_order: ObjectSortOrder,
+    compressed: bool | None,
+    search_key: str | None,
+    window: int,
+) -> tuple[list[LogicalObject], int]:
+    """Return the first ``window`` objects in sort order plus the filtered total.
+
+    When the window is small relative to the listing, a bounded heap selection
+    (O(N log k)) replaces the full sort; ``heapq.nsmallest``/``nlargest`` match
+    ``sorted(...)[:window]`` including tie order.
+    """
+    filtered = _filter_objects(objects, compressed, search_key)
+    total = len(filtered)
+    sort_key, reverse = _SORT_KEYS[sort_order]
+    if window * 8 < total:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(window, filtered, key=sort_key), total
+    filtered.sort(key=sort_key, reverse=reverse)
+    return filtered, total
+
+
 class _S3ContextMixin:
     sdk: DeltaGliderSDK
 
@@ -132,6 +168,11 @@ class _CatalogCacheManager:
         if self.list_cache is not None:
             self.list_cache.invalidate_bucket(bucket)
 
+    def invalidate_object_listings(self, bucket: str, keys: Iterable[str]) -> None:
+        """Drop cached listings that could show any of ``keys``; other prefixes stay cached."""
+        if self.list_cache is not None:
+            self.list_cache.invalidate_keys(bucket, keys)
+
 
 @dataclass(slots=True)
 class BucketStatsService(_S3ContextMixin):
@@ -374,27 +415,35 @@ class ObjectListingService(_S3ContextMixin):
         if bypass_cache and self.list_cache is not None:
             self.list_cache.invalidate_bucket(bucket)
 
-        sorted_objects: list[LogicalObject] | None = None
-        base_objects: list[LogicalObject] | None = None
-        common_prefixes: list[str] = []
+        sorted_objects: Sequence[LogicalObject] | None = None
+        base_objects: Sequence[LogicalObject] | None = None
+        sorted_index: Sequence[LogicalObject] | None = None
+        common_prefixes: Sequence[str] = ()
+        # Filtered row count when only a leading window of sorted_objects was materialized.
+        total: int | None = None
 
         if cache is not None and credentials_key is not None:
-            lookup = cache.get_variant(credentials_key, bucket, prefix, sort_key, compressed, search_key)
+            lookup = cache.get_variant(
+                credentials_key, bucket, prefix, sort_key, compressed, search_key, page=(offset, limit)
+            )
+            if lookup is not None and lookup.page is not None:
+                return lookup.page
             if lookup is not None:
                 if lookup.common_prefixes is not None:
                     common_prefixes = lookup.common_prefixes
                 if lookup.variant is not None:
                     sorted_objects = lookup.variant
                 else:
-                    base_objects = lookup.base_objects or []
+                    base_objects = lookup.base_objects or ()
+                    sorted_index = lookup.sorted_index
 
         if sorted_objects is None:
             if base_objects is None:
                 listing = self.sdk.list_objects(
                     bucket, prefix, max_items=LISTING_MAX_OBJECTS, quick_mode=not fetch_metadata
                 )
-                base_objects = list(listing.objects)
-                common_prefixes = list(listing.common_prefixes)
+                base_objects = listing.objects
+                common_prefixes = listing.common_prefixes
 
                 if cache is not None and credentials_key is not None:
                     cache.prime_listing(
@@ -402,15 +451,28 @@ class ObjectListingService(_S3ContextMixin):
                         bucket,
                         prefix,
                         base_objects,
-                        list(listing.common_prefixes),
+                        common_prefixes,
                     )
-            else:
-                common_prefixes = common_prefixes or []
-
-            sorted_objects = _filter_and_sort(base_objects, sort_order, compressed, search_key)
 
-            if cache is not None and credentials_key is not None:
-                cache.store_variant(
+            if cache is None or credentials_key is None:
+                # Nothing will reuse a full sort here, so only order rows up to the requested page.
+                sorted_objects, total = _filter_and_select(
+                    base_objects, sort_order, compressed, search_key, offset + limit
+                )
+            else:
+                filtered = compressed is not None or bool(search_key)
+                if sorted_index is None:
+                    # Sort the whole listing once per sort order; every filter and search
+                    # variant is then a linear pass over it, since filtering keeps the order.
+                    sorted_index = _filter_and_sort(base_objects, sort_order, None, None)
+                    if filtered:
+                        stored_index = cache.store_variant(
+                            credentials_key, bucket, prefix, sort_key, None, None, sorted_index
+                        )
+                        if stored_index is not None:
+                            sorted_index = stored_index
+                sorted_objects = _filter_objects(sorted_index, compressed, search_key) if filtered else sorted_index
+                stored = cache.store_variant(
                     credentials_key,
                     bucket,
                     prefix,
@@ -419,9 +481,14 @@ class ObjectListingService(_S3ContextMixin):
                     search_key,
                     sorted_objects,
                 )
+                # Paginate the frozen tuple later hits will share rather than the scratch list.
+                if stored is not None:
+                    sorted_objects = stored
 
+        if total is None:
+            total = len(sorted_objects)
         page = sorted_objects[offset : offset + limit]
-        next_cursor = encode_cursor(offset + len(page)) if offset + len(page) < len(sorted_objects) else None
+        next_cursor = encode_cursor(offset + len(page)) if offset + len(page) < total else None
 
         # base_objects is set when we fetched from SDK or got the base from cache.
         # When sorted_objects came directly from a cached variant, base_objects is
@@ -429,8 +496,8 @@ class ObjectListingService(_S3ContextMixin):
         fetched_count = len(base_objects) if base_objects is not None else len(sorted_objects)
         limited = fetched_count >= LISTING_MAX_OBJECTS
 
-        return ObjectList(
-            objects=[
+        result = ObjectList(
+            objects=tuple(
                 ObjectItem(
                     key=obj.key,
                     original_bytes=obj.original_bytes,
@@ -439,11 +506,15 @@ class ObjectListingService(_S3ContextMixin):
                     modified=obj.modified,
                 )
                 for obj in page
-            ],
-            common_prefixes=common_prefixes,
+            ),
+            common_prefixes=tuple(common_prefixes),
             cursor=next_cursor,
             limited=limited,
         )
+        if cache is not None and credentials_key is not None:
+            # Repeat requests for this window return the same object, and its encoded body.
+            cache.store_page(credentials_key, bucket, prefix, sort_key, compressed, search_key, offset, limit, result)
+        return result
 
     def get_metadata(self, bucket: str, key: str) -> FileMetadata:
         metadata = self.sdk.get_metadata(bucket, key)
@@ -458,7 +529,7 @@ class ObjectMutationService(_S3ContextMixin):
     def delete_object(self, bucket: str, key: str) -> None:
         try:
             self.sdk.delete_object(bucket, key)
-            self.cache_manager.invalidate_listing(bucket)
+            self.cache_manager.invalidate_object_listings(bucket, (key,))
             self.cache_manager.invalidate_bucket_stats(bucket)
         except ClientError as exc:
             error_code = exc.response.get("Error", {}).get("Code", "")
@@ -484,7 +555,7 @@ class ObjectMutationService(_S3ContextMixin):
         try:
             self.sdk.delete_objects(bucket, keys)
             deleted = list(keys)
-            self.cache_manager.invalidate_listing(bucket)
+            self.cache_manager.invalidate_object_listings(bucket, deleted)
             self.cache_manager.invalidate_bucket_stats(bucket)
         except NotFoundError:
             for key in keys:
@@ -509,7 +580,7 @@ class ObjectMutationService(_S3ContextMixin):
     ) -> UploadSummary:
         try:
             summary = self.sdk.upload(bucket, key, file_obj)
-            self.cache_manager.invalidate_listing(bucket)
+            self.cache_manager.invalidate_object_listings(bucket, (key,))
             self.cache_manager.invalidate_bucket_stats(bucket)
         except APIError:
             raise
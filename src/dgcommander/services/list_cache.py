@@ -4,17 +4,29 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import sys
+import time
+from bisect import bisect_left, insort
+from collections.abc import Callable, Hashable, Iterable, Sequence
 from dataclasses import dataclass, field
-from threading import RLock
-from typing import TYPE_CHECKING
-
-from cachetools import TTLCache
+from functools import lru_cache
+from itertools import count
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..services.deltaglider import LogicalObject
+    from ..util.types import ObjectList
 
 logger = logging.getLogger(__name__)
 
+# (credentials_key, bucket, prefix); credentials_key is already a digest of the credential set.
+_CacheKey = tuple[str, str, str]
+_VariantKey = tuple[str, bool | None, str]
+
+# Rendered pages kept per listing before the page map is reset; bounds memory for long scrolls.
+_MAX_PAGES_PER_LISTING = 64
+
 
 def make_credentials_cache_key(credentials: dict | None) -> str:
     """Generate stable cache key from S3 credentials.
@@ -33,56 +45,179 @@ def make_credentials_cache_key(credentials: dict | None) -> str:
 
     # Use endpoint and access_key_id to uniquely identify credential set
     # Don't include secret_access_key (for logging safety)
-    cred_parts = [
+    return _credentials_cache_key(
         credentials.get("endpoint", ""),
         credentials.get("access_key_id", ""),
         credentials.get("region", ""),
-    ]
-    cred_str = "|".join(cred_parts)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _credentials_cache_key(endpoint: str, access_key_id: str, region: str) -> str:
+    # Every listing request derives the key from the same few credential sets.
+    cred_str = "|".join((endpoint, access_key_id, region))
     return hashlib.sha256(cred_str.encode()).hexdigest()[:16]
 
 
+class FastTTLDict:
+    """Bounded TTL mapping costing one dict probe and one clock read per lookup.
+
+    Entries are stored as ``[value, expires_at, last_access]`` records in a plain dict.
+    The TTL is the same for every entry and a write re-inserts its key at the end, so
+    insertion order is expiry order: expired entries are swept lazily from the front
+    without a heap or timer structure.
+
+    Recency is tracked lazily: a read only stamps the record with the next value of a
+    shared counter, without reordering anything. When the mapping grows past
+    ``maxsize`` it is trimmed in one pass down to the most recently used half, so
+    eviction cost is amortized across the writes that filled it.
+
+    ``on_drop`` is called with each key the mapping removes by itself (expiry or
+    eviction), so owners can keep side indexes in step without scanning them.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_timer", "_data", "_ticks", "_on_drop")
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        on_drop: Callable[[Any], None] | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: dict[Hashable, list[Any]] = {}
+        self._ticks = count()
+        self._on_drop = on_drop
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[1] <= self._timer():
+            del self._data[key]
+            if self._on_drop is not None:
+                self._on_drop(key)
+            return default
+        entry[2] = next(self._ticks)
+        return entry[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        now = self._timer()
+        data = self._data
+        data.pop(key, None)
+        data[key] = [value, now + self.ttl, next(self._ticks)]
+        self._expire(now)
+        if len(data) > self.maxsize:
+            self._evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        return entry[0]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def _expire(self, now: float) -> None:
+        data = self._data
+        on_drop = self._on_drop
+        while data:
+            oldest = next(iter(data))
+            if data[oldest][1] > now:
+                break
+            del data[oldest]
+            if on_drop is not None:
+                on_drop(oldest)
+
+    def _evict(self) -> None:
+        # Always keep the entry just written, even when maxsize is 1.
+        keep = max(1, self.maxsize // 2)
+        by_recency = sorted(self._data.items(), key=lambda item: item[1][2])
+        on_drop = self._on_drop
+        for key, _entry in by_recency[: len(by_recency) - keep]:
+            del self._data[key]
+            if on_drop is not None:
+                on_drop(key)
+
+
 @dataclass(slots=True)
 class CachedListing:
     """Cached listing with lazily-computed variants."""
 
     objects: tuple[LogicalObject, ...]
     common_prefixes: tuple[str, ...]
-    _variants: dict[str, tuple[LogicalObject, ...]] = field(default_factory=dict, repr=False)
+    # Allocated on first store_variant; many listings expire without ever getting one.
+    _variants: dict[_VariantKey, tuple[LogicalObject, ...]] | None = field(default=None, repr=False)
+    # (variant, offset, limit) -> rendered page, for repeat requests of the same page.
+    _pages: dict[tuple[_VariantKey, int, int], ObjectList] | None = field(default=None, repr=False)
 
     @classmethod
-    def from_lists(cls, objects: list[LogicalObject], common_prefixes: list[str]) -> CachedListing:
+    def from_lists(cls, objects: Sequence[LogicalObject], common_prefixes: Sequence[str]) -> CachedListing:
         """Create from mutable lists."""
 
         return cls(objects=tuple(objects), common_prefixes=tuple(common_prefixes))
 
-    def get_variant(self, sort_order: str, compressed: bool | None, search: str | None) -> list[LogicalObject] | None:
-        key = self._variant_key(sort_order, compressed, search)
-        variant = self._variants.get(key)
-        if variant is None:
+    def get_variant(
+        self, sort_order: str, compressed: bool | None, search: str | None
+    ) -> tuple[LogicalObject, ...] | None:
+        """Return the shared, immutable variant tuple (no per-hit copy)."""
+
+        if self._variants is None:
             return None
-        return list(variant)
+        key = self._variant_key(sort_order, compressed, search)
+        return self._variants.get(key)
 
     def store_variant(
-        self, sort_order: str, compressed: bool | None, search: str | None, objects: list[LogicalObject]
-    ) -> None:
+        self, sort_order: str, compressed: bool | None, search: str | None, objects: Sequence[LogicalObject]
+    ) -> tuple[LogicalObject, ...]:
+        if self._variants is None:
+            self._variants = {}
         key = self._variant_key(sort_order, compressed, search)
-        self._variants[key] = tuple(objects)
+        frozen = tuple(objects)
+        self._variants[key] = frozen
+        return frozen
+
+    def get_page(
+        self, sort_order: str, compressed: bool | None, search: str | None, offset: int, limit: int
+    ) -> ObjectList | None:
+        if self._pages is None:
+            return None
+        return self._pages.get((self._variant_key(sort_order, compressed, search), offset, limit))
+
+    def store_page(
+        self, sort_order: str, compressed: bool | None, search: str | None, offset: int, limit: int, page: ObjectList
+    ) -> None:
+        if self._pages is None or len(self._pages) >= _MAX_PAGES_PER_LISTING:
+            self._pages = {}
+        self._pages[(self._variant_key(sort_order, compressed, search), offset, limit)] = page
 
     @staticmethod
-    def _variant_key(sort_order: str, compressed: bool | None, search: str | None) -> str:
-        search_key = (search or "").lower()
-        compression_key = "all" if compressed is None else str(compressed)
-        return f"{sort_order}|{compression_key}|{search_key}"
+    def _variant_key(sort_order: str, compressed: bool | None, search: str | None) -> _VariantKey:
+        # A plain tuple hashes its parts directly; no string formatting per lookup.
+        return (sort_order, compressed, search.lower() if search else "")
 
 
 @dataclass(slots=True)
 class VariantLookup:
-    """Result from cache lookup for an object listing variant."""
+    """Result from cache lookup for an object listing variant.
+
+    The sequences are the cache's own immutable tuples and are shared between requests.
+    """
 
-    variant: list[LogicalObject] | None
-    base_objects: list[LogicalObject] | None
-    common_prefixes: list[str] | None
+    variant: tuple[LogicalObject, ...] | None
+    base_objects: tuple[LogicalObject, ...] | None
+    common_prefixes: tuple[str, ...] | None
+    # Unfiltered variant for the same sort order, if cached; filtering it keeps the order.
+    sorted_index: tuple[LogicalObject, ...] | None = None
+    # Previously rendered page for the requested window, on a variant hit.
+    page: ObjectList | None = None
 
 
 class ListObjectsCache:
@@ -101,24 +236,25 @@ class ListObjectsCache:
 
         Args:
             ttl_seconds: Time-to-live for cached entries in seconds (default: 5)
-            max_size: Maximum number of cached entries (LRU eviction, default: 100)
+            max_size: Maximum number of cached entries (lazy LRU eviction, default: 100)
         """
-        self._cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
-        self._lock = RLock()
+        # Expired and evicted keys are dropped from the bucket/prefix indexes as they go,
+        # so the indexes never outgrow the cache itself.
+        self._cache = FastTTLDict(maxsize=max_size, ttl=ttl_seconds, on_drop=self._remove_key)
+        self._lock = Lock()
         self._hits = 0
         self._misses = 0
-        self._bucket_index: dict[str, set[str]] = {}
-        self._prefix_index: dict[tuple[str, str], set[str]] = {}
-        self._key_index: dict[str, tuple[str, str]] = {}
+        self._bucket_index: dict[str, set[_CacheKey]] = {}
+        self._prefix_index: dict[tuple[str, str], set[_CacheKey]] = {}
+        self._prefix_by_bucket: dict[str, list[str]] = {}
         logger.info(f"Initialized ListObjectsCache with ttl={ttl_seconds}s, max_size={max_size}")
 
-    def _make_key(self, credentials_key: str, bucket: str, prefix: str) -> str:
+    def _make_key(self, credentials_key: str, bucket: str, prefix: str) -> _CacheKey:
         """Generate cache key based on credentials and location."""
 
-        key_parts = [credentials_key, bucket, prefix]
-        key_str = "|".join(key_parts)
-        # Use hash for shorter keys
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        # A plain tuple: hashing it reuses each string's cached hash, with no encode/digest
+        # per lookup, and equality compares the full credentials key rather than a truncated hash.
+        return (credentials_key, bucket, prefix)
 
     def get_listing(self, credentials_key: str, bucket: str, prefix: str) -> CachedListing | None:
         """Retrieve cached base listing if available."""
@@ -128,36 +264,43 @@ class ListObjectsCache:
             cached = self._cache.get(key)
             if cached is not None:
                 self._hits += 1
-                logger.debug(
-                    f"Cache HIT for creds={credentials_key[:8]}... {bucket}/{prefix} "
-                    f"(hits={self._hits}, misses={self._misses})"
-                )
-                return cached
-            self._misses += 1
-            logger.debug(
-                f"Cache MISS for creds={credentials_key[:8]}... {bucket}/{prefix} "
-                f"(hits={self._hits}, misses={self._misses})"
-            )
-            return None
+            else:
+                self._misses += 1
+            hits, misses = self._hits, self._misses
+        logger.debug(
+            "Cache %s for creds=%s... %s/%s (hits=%d, misses=%d)",
+            "HIT" if cached is not None else "MISS",
+            credentials_key[:8],
+            bucket,
+            prefix,
+            hits,
+            misses,
+        )
+        return cached
 
     def prime_listing(
         self,
         credentials_key: str,
         bucket: str,
         prefix: str,
-        objects: list[LogicalObject],
-        common_prefixes: list[str],
+        objects: Sequence[LogicalObject],
+        common_prefixes: Sequence[str],
     ) -> None:
         """Store base listing data in cache."""
 
-        key = self._make_key(credentials_key, bucket, prefix)
+        # Few distinct buckets/prefixes back many entries; interning here shares one string
+        # object per value between the stored key and every index, so probes short-circuit
+        # on identity.
+        key = self._make_key(credentials_key, sys.intern(bucket), sys.intern(prefix))
         cached = CachedListing.from_lists(objects, common_prefixes)
         with self._lock:
+            # Register first: the insert may expire or evict this very key, and the drop
+            # callback can only unregister what is already indexed.
+            self._register_key(key)
             self._cache[key] = cached
-            self._register_key(key, bucket, prefix)
-            logger.debug(
-                f"Cached base listing ({len(objects)} objects) for creds={credentials_key[:8]}... {bucket}/{prefix}"
-            )
+        logger.debug(
+            "Cached base listing (%d objects) for creds=%s... %s/%s", len(objects), credentials_key[:8], bucket, prefix
+        )
 
     def get_variant(
         self,
@@ -167,33 +310,50 @@ class ListObjectsCache:
         sort_order: str,
         compressed: bool | None,
         search: str | None,
+        page: tuple[int, int] | None = None,
     ) -> VariantLookup | None:
-        """Retrieve cached variant or provide base data for recomputation."""
+        """Retrieve cached variant or provide base data for recomputation.
+
+        When ``page`` is an ``(offset, limit)`` window and the variant is cached, a page
+        previously stored for that window is returned with it.
+        """
 
         key = self._make_key(credentials_key, bucket, prefix)
+        sorted_index = None
+        cached_page = None
         with self._lock:
             cached = self._cache.get(key)
             if cached is None:
                 self._misses += 1
-                self._remove_key(key)
-                logger.debug(f"Cache MISS for creds={credentials_key[:8]}... {bucket}/{prefix} (no base listing)")
-                return None
-
-            variant = cached.get_variant(sort_order, compressed, search)
-            common_prefixes = list(cached.common_prefixes)
-            if variant is not None:
-                self._hits += 1
-                logger.debug(f"Variant HIT for creds={credentials_key[:8]}... {bucket}/{prefix} ({sort_order})")
-                return VariantLookup(variant=variant, base_objects=None, common_prefixes=common_prefixes)
-
-            self._misses += 1
-            logger.debug(f"Variant MISS for creds={credentials_key[:8]}... {bucket}/{prefix} ({sort_order})")
+                variant = None
+            else:
+                variant = cached.get_variant(sort_order, compressed, search)
+                if variant is not None:
+                    self._hits += 1
+                    if page is not None:
+                        cached_page = cached.get_page(sort_order, compressed, search, *page)
+                else:
+                    self._misses += 1
+                    sorted_index = cached.get_variant(sort_order, None, None)
+
+        # Logging and result construction happen outside the critical section.
+        if cached is None:
+            logger.debug("Cache MISS for creds=%s... %s/%s (no base listing)", credentials_key[:8], bucket, prefix)
+            return None
+        if variant is not None:
+            logger.debug("Variant HIT for creds=%s... %s/%s (%s)", credentials_key[:8], bucket, prefix, sort_order)
             return VariantLookup(
-                variant=None,
-                base_objects=list(cached.objects),
-                common_prefixes=common_prefixes,
+                variant=variant, base_objects=None, common_prefixes=cached.common_prefixes, page=cached_page
             )
 
+        logger.debug("Variant MISS for creds=%s... %s/%s (%s)", credentials_key[:8], bucket, prefix, sort_order)
+        return VariantLookup(
+            variant=None,
+            base_objects=cached.objects,
+            common_prefixes=cached.common_prefixes,
+            sorted_index=sorted_index,
+        )
+
     def store_variant(
         self,
         credentials_key: str,
@@ -202,42 +362,82 @@ class ListObjectsCache:
         sort_order: str,
         compressed: bool | None,
         search: str | None,
-        objects: list[LogicalObject],
-    ) -> None:
-        """Persist a computed variant for later reuse."""
+        objects: Sequence[LogicalObject],
+    ) -> tuple[LogicalObject, ...] | None:
+        """Persist a computed variant for later reuse.
+
+        Returns the stored tuple, which later cache hits share, or ``None`` if the base
+        listing has expired.
+        """
 
         key = self._make_key(credentials_key, bucket, prefix)
         with self._lock:
             cached = self._cache.get(key)
             if cached is None:
-                return
-            cached.store_variant(sort_order, compressed, search, objects)
-            logger.debug(f"Cached variant ({sort_order}) for creds={credentials_key[:8]}... {bucket}/{prefix}")
+                return None
+            stored = cached.store_variant(sort_order, compressed, search, objects)
+        logger.debug("Cached variant (%s) for creds=%s... %s/%s", sort_order, credentials_key[:8], bucket, prefix)
+        return stored
+
+    def store_page(
+        self,
+        credentials_key: str,
+        bucket: str,
+        prefix: str,
+        sort_order: str,
+        compressed: bool | None,
+        search: str | None,
+        offset: int,
+        limit: int,
+        page: ObjectList,
+    ) -> None:
+        """Keep a rendered page with its listing so repeat requests skip pagination and encoding."""
+
+        key = self._make_key(credentials_key, bucket, prefix)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                cached.store_page(sort_order, compressed, search, offset, limit, page)
 
     def invalidate_bucket(self, bucket: str) -> None:
         """Invalidate all cache entries for a specific bucket.
 
         Called when objects are uploaded, deleted, or modified in the bucket.
         """
+        bucket = sys.intern(bucket)
         with self._lock:
             keys = list(self._bucket_index.get(bucket, set()))
             for key in keys:
                 self._cache.pop(key, None)
                 self._remove_key(key)
-            logger.debug(f"Invalidated {len(keys)} cache entr{'y' if len(keys) == 1 else 'ies'} for bucket: {bucket}")
+        logger.debug("Invalidated %d cache entr%s for bucket: %s", len(keys), "y" if len(keys) == 1 else "ies", bucket)
 
-    def invalidate_prefix(self, bucket: str, prefix: str) -> None:
-        """Invalidate cache entries for a specific bucket and prefix.
+    def invalidate_keys(self, bucket: str, keys: Iterable[str]) -> None:
+        """Invalidate only the cached listings whose prefix contains any of ``keys``.
 
-        More granular than invalidate_bucket, but still clears entire cache for simplicity.
+        Adding or removing ``data/a.txt`` can change the listings of ``""``, ``"data"``
+        and ``"data/"``, but not of ``"logs/"``; those stay cached. Each key's ancestor
+        prefixes are looked up by binary search in the sorted per-bucket prefixes.
         """
-        key = (bucket, prefix)
+        bucket = sys.intern(bucket)
+        normalized = {key.lstrip("/") for key in keys}
         with self._lock:
-            keys = list(self._prefix_index.get(key, set()))
-            for cache_key in keys:
+            prefixes: set[str] = set()
+            for key in normalized:
+                prefixes.update(self._ancestor_prefixes(bucket, key))
+            cache_keys: list[_CacheKey] = []
+            for cached_prefix in prefixes:
+                cache_keys.extend(self._prefix_index.get((bucket, cached_prefix), ()))
+            for cache_key in cache_keys:
                 self._cache.pop(cache_key, None)
                 self._remove_key(cache_key)
-            logger.debug(f"Invalidated {len(keys)} cache entr{'y' if len(keys) == 1 else 'ies'} for {bucket}/{prefix}")
+        logger.debug(
+            "Invalidated %d cache entr%s for %d key(s) in bucket: %s",
+            len(cache_keys),
+            "y" if len(cache_keys) == 1 else "ies",
+            len(normalized),
+            bucket,
+        )
 
     def clear(self) -> None:
         """Clear all cache entries."""
@@ -245,10 +445,10 @@ class ListObjectsCache:
             self._cache.clear()
             self._bucket_index.clear()
             self._prefix_index.clear()
-            self._key_index.clear()
+            self._prefix_by_bucket.clear()
             self._hits = 0
             self._misses = 0
-            logger.info("Cache cleared")
+        logger.info("Cache cleared")
 
     def stats(self) -> dict[str, int | float]:
         """Get cache statistics."""
@@ -264,26 +464,56 @@ class ListObjectsCache:
                 "max_size": self._cache.maxsize,
             }
 
-    def _register_key(self, key: str, bucket: str, prefix: str) -> None:
-        self._key_index[key] = (bucket, prefix)
+    def _register_key(self, key: _CacheKey) -> None:
+        _credentials_key, bucket, prefix = key
         self._bucket_index.setdefault(bucket, set()).add(key)
-        self._prefix_index.setdefault((bucket, prefix), set()).add(key)
+        prefix_keys = self._prefix_index.setdefault((bucket, prefix), set())
+        if not prefix_keys:
+            insort(self._prefix_by_bucket.setdefault(bucket, []), prefix)
+        prefix_keys.add(key)
 
-    def _remove_key(self, key: str) -> None:
-        info = self._key_index.pop(key, None)
-        if info is None:
-            return
-        bucket, prefix = info
+    def _remove_key(self, key: _CacheKey) -> None:
+        _credentials_key, bucket, prefix = key
         bucket_keys = self._bucket_index.get(bucket)
-        if bucket_keys is not None:
-            bucket_keys.discard(key)
-            if not bucket_keys:
-                self._bucket_index.pop(bucket, None)
+        if bucket_keys is None or key not in bucket_keys:
+            return
+        bucket_keys.discard(key)
+        if not bucket_keys:
+            self._bucket_index.pop(bucket, None)
         prefix_keys = self._prefix_index.get((bucket, prefix))
         if prefix_keys is not None:
             prefix_keys.discard(key)
             if not prefix_keys:
                 self._prefix_index.pop((bucket, prefix), None)
+                self._discard_sorted_prefix(bucket, prefix)
+
+    def _ancestor_prefixes(self, bucket: str, key: str) -> list[str]:
+        """Cached prefixes of ``bucket`` that ``key`` (without leading slashes) falls under."""
+        sorted_prefixes = self._prefix_by_bucket.get(bucket)
+        if not sorted_prefixes:
+            return []
+        found = []
+        for end in range(len(key) + 1):
+            candidate = key[:end]
+            idx = bisect_left(sorted_prefixes, candidate)
+            if idx < len(sorted_prefixes) and sorted_prefixes[idx] == candidate:
+                found.append(candidate)
+        # Prefixes requested with leading slashes sort together ("0" follows "/"); they are
+        # rare, so they are matched directly after stripping.
+        start = bisect_left(sorted_prefixes, "/")
+        stop = bisect_left(sorted_prefixes, "0", start)
+        found.extend(prefix for prefix in sorted_prefixes[start:stop] if key.startswith(prefix.lstrip("/")))
+        return found
+
+    def _discard_sorted_prefix(self, bucket: str, prefix: str) -> None:
+        sorted_prefixes = self._prefix_by_bucket.get(bucket)
+        if sorted_prefixes is None:
+            return
+        idx = bisect_left(sorted_prefixes, prefix)
+        if idx < len(sorted_prefixes) and sorted_prefixes[idx] == prefix:
+            del sorted_prefixes[idx]
+        if not sorted_prefixes:
+            self._prefix_by_bucket.pop(bucket, None)
 
 
-__all__ = ["ListObjectsCache", "CachedListing", "VariantLookup"]
+__all__ = ["ListObjectsCache", "CachedListing", "FastTTLDict", "VariantLookup"]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import logging
+import time
+
+from botocore.exceptions import ClientError
 
 from ..util.errors import NotFoundError
 from ..util.types import PresignedUrlResponse
 from .deltaglider import DeltaGliderSDK
 
+logger = logging.getLogger(__name__)
+
 
 class PresignedUrlService:
     """Service for generating presigned URLs with automatic deltaglider rehydration."""
@@ -35,12 +40,9 @@ class PresignedUrlService:
         try:
             # Check if object exists and get size estimate
             estimated_size = self._sdk.estimated_object_size(bucket, key)
-        except (FileNotFoundError, Exception) as exc:
+        except (FileNotFoundError, KeyError, ClientError) as exc:
             # If we can't get the size, it might be because the object doesn't exist
             # or there's an issue with the deltaglider metadata lookup
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to get estimated size for {bucket}/{key}: {exc}")
             raise NotFoundError("object", "key_not_found") from exc
 
@@ -62,7 +64,7 @@ class PresignedUrlService:
             download_url = f"https://s3.amazonaws.com/{bucket}/{key}?X-Amz-Expires={expires_in}"
 
         # Calculate expiration time
-        expires_at = datetime.now(UTC).timestamp() + expires_in
+        expires_at = time.time() + expires_in
 
         return PresignedUrlResponse(
             bucket=bucket,
@@ -21,17 +21,22 @@ class ObjectSortOrder(StrEnum):
         if not sort:
             return cls.modified_desc
 
-        key = sort.lower()
-        dir_normalized = (direction or "desc").lower()
+        orders = _SORT_DISPATCH.get(sort.lower())
+        if orders is None:
+            return cls.modified_desc
+
+        desc_order, asc_order = orders
+        return desc_order if (direction or "desc").lower() == "desc" else asc_order
 
-        if key in {"name", "key"}:
-            return cls.name_desc if dir_normalized == "desc" else cls.name_asc
-        if key in {"size", "original_bytes"}:
-            return cls.size_desc if dir_normalized == "desc" else cls.size_asc
-        if key == "modified":
-            return cls.modified_desc if dir_normalized == "desc" else cls.modified_asc
 
-        return cls.modified_desc
+# Lowercased sort field -> (descending order, ascending order); built once at import time.
+_SORT_DISPATCH: dict[str, tuple[ObjectSortOrder, ObjectSortOrder]] = {
+    "name": (ObjectSortOrder.name_desc, ObjectSortOrder.name_asc),
+    "key": (ObjectSortOrder.name_desc, ObjectSortOrder.name_asc),
+    "size": (ObjectSortOrder.size_desc, ObjectSortOrder.size_asc),
+    "original_bytes": (ObjectSortOrder.size_desc, ObjectSortOrder.size_asc),
+    "modified": (ObjectSortOrder.modified_desc, ObjectSortOrder.modified_asc),
+}
 
 
 __all__ = ["ObjectSortOrder"]
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from flask import Flask, jsonify
+from flask import Flask, Response
+
+from .json import dumps_json, raw_json_response
 
 
 @dataclass(slots=True)
@@ -28,6 +31,16 @@ class APIError(Exception):
             payload["error"]["details"] = self.details
         return payload
 
+    def to_response(self) -> Response:
+        # Errors without details are fully determined by (code, message); reuse their bytes.
+        body = dumps_json(self.to_dict()) if self.details else _encode_error(self.code, self.message)
+        return raw_json_response(body, self.http_status)
+
+
+@lru_cache(maxsize=256)
+def _encode_error(code: str, message: str) -> bytes:
+    return dumps_json({"error": {"code": code, "message": message}})
+
 
 class RateLimitExceeded(APIError):
     def __init__(self, message: str = "Rate limit exceeded") -> None:
@@ -73,19 +86,13 @@ def register_error_handlers(app: Flask) -> None:
 
     @app.errorhandler(APIError)
     def handle_api_error(err: APIError):  # type: ignore[override]
-        response = jsonify(err.to_dict())
-        response.status_code = err.http_status
-        return response
+        return err.to_response()
 
     @app.errorhandler(404)
     def handle_404(_err):  # type: ignore[override]
-        response = jsonify({"error": {"code": "not_found", "message": "Route not found"}})
-        response.status_code = 404
-        return response
+        return raw_json_response(_encode_error("not_found", "Route not found"), 404)
 
     @app.errorhandler(Exception)
     def handle_unexpected(err: Exception):  # type: ignore[override]
         app.logger.exception("Unhandled exception", exc_info=err)
-        response = jsonify({"error": {"code": "internal_error", "message": "Internal server error"}})
-        response.status_code = 500
-        return response
+        return raw_json_response(_encode_error("internal_error", "Internal server error"), 500)
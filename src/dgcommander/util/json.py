@@ -2,16 +2,62 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, cast
 
+import orjson
 from flask import Response, make_response
+from flask.json.provider import DefaultJSONProvider
+
+# Timezone-aware UTC datetimes serialize with a "Z" suffix; naive datetimes are treated as UTC.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+# jsonify keeps Flask's conventions: dates go through the provider default (HTTP date format).
+_PROVIDER_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Encode ``payload`` to UTF-8 JSON bytes; dataclass instances are serialized natively."""
+    return orjson.dumps(payload, option=_ORJSON_OPTIONS)
 
 
 def json_response(payload: Any, status: int = 200) -> Response:
-    # Use explicit JSON serialization with proper headers
-    json_data = json.dumps(payload, ensure_ascii=False)
-    response = make_response(json_data, status)
+    return raw_json_response(dumps_json(payload), status)
+
+
+def raw_json_response(body: bytes, status: int = 200) -> Response:
+    # Setting bytes as the body already populates Content-Length from their length.
+    response = make_response(body, status)
     response.headers["Content-Type"] = "application/json; charset=utf-8"
-    response.headers["Content-Length"] = str(len(json_data.encode("utf-8")))
     return response
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for ``jsonify`` and ``request.get_json``.
+
+    Output matches the default provider apart from emitting UTF-8 instead of
+    ``\\u`` escapes; unsupported types still fall back to :meth:`default`.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._encode(obj, kwargs).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        # orjson takes no decoder options; keep them working through the stdlib provider.
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._encode(obj, {"indent": 2} if pretty else {})
+        # Typed as the sansio base on the provider; at runtime it is the Flask app's class.
+        response_class = cast("type[Response]", self._app.response_class)
+        return response_class(body + b"\n", mimetype=self.mimetype)
+
+    def _encode(self, obj: Any, kwargs: dict[str, Any]) -> bytes:
+        option = _PROVIDER_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option)
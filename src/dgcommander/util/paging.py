@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import struct
 
 from .errors import APIError
 
@@ -23,25 +24,32 @@ def coerce_limit(raw: str | None, *, default: int = 200, minimum: int = 1, maxim
     return value
 
 
-_CURSOR_PREFIX = "offset:"
+# Cursors carry a fixed-width big-endian offset: 8 bytes encode to 11 urlsafe base64 characters
+# once the padding is stripped.
+_CURSOR_STRUCT = struct.Struct("!Q")
+_PACK = _CURSOR_STRUCT.pack
+_UNPACK = _CURSOR_STRUCT.unpack
+# Cursors issued before the fixed-width format wrapped ``offset:<n>`` and are still accepted.
+_LEGACY_CURSOR_PREFIX = b"offset:"
 
 
 def encode_cursor(offset: int) -> str:
-    payload = f"{_CURSOR_PREFIX}{offset}".encode()
-    return base64.urlsafe_b64encode(payload).decode("ascii")
+    return base64.urlsafe_b64encode(_PACK(offset)).rstrip(b"=").decode("ascii")
 
 
 def decode_cursor(raw: str | None) -> int | None:
     if not raw:
         return None
     try:
-        decoded_bytes = base64.b64decode(raw.encode("ascii"), altchars=b"-_", validate=True)
-        decoded = decoded_bytes.decode("utf-8")
-    except (ValueError, UnicodeDecodeError) as exc:
-        raise APIError(code="invalid_cursor", message="Invalid cursor", http_status=400) from exc
-    if not decoded.startswith(_CURSOR_PREFIX):
-        raise APIError(code="invalid_cursor", message="Invalid cursor", http_status=400)
-    try:
-        return int(decoded[len(_CURSOR_PREFIX) :])
-    except ValueError as exc:  # pragma: no cover - defensive
+        decoded = base64.b64decode(raw + "=" * (-len(raw) % 4), altchars=b"-_", validate=True)
+    except ValueError as exc:
         raise APIError(code="invalid_cursor", message="Invalid cursor", http_status=400) from exc
+    # Check the legacy prefix first: "offset:<digit>" is itself 8 bytes long.
+    if decoded.startswith(_LEGACY_CURSOR_PREFIX):
+        try:
+            return int(decoded[len(_LEGACY_CURSOR_PREFIX) :])
+        except ValueError as exc:  # pragma: no cover - defensive
+            raise APIError(code="invalid_cursor", message="Invalid cursor", http_status=400) from exc
+    if len(decoded) == _CURSOR_STRUCT.size:
+        return int(_UNPACK(decoded)[0])
+    raise APIError(code="invalid_cursor", message="Invalid cursor", http_status=400)
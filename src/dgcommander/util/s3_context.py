@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -18,6 +20,19 @@ class S3Context:
     region: str
 
 
+@lru_cache(maxsize=64)
+def _build_context(endpoint: str, access_key: str, region: str) -> S3Context:
+    # Endpoints, access keys and regions repeat across requests, so error storms reuse one
+    # frozen context per combination; the key preview is only sliced on a cache miss.
+    # Credential dicts are user input, so values are coerced to str before interning; an
+    # explicit None region is kept as given.
+    return S3Context(
+        endpoint=sys.intern(str(endpoint)),
+        access_key_preview=f"{access_key[:8]}..." if len(access_key) > 8 else access_key,
+        region=sys.intern(str(region)) if region is not None else region,
+    )
+
+
 def extract_s3_context_from_sdk(sdk: Any) -> S3Context | None:
     """
     Extract S3 context from an SDK instance.
@@ -46,16 +61,10 @@ def extract_s3_context_from_settings(settings: S3Settings) -> S3Context:
     Returns:
         S3Context with connection information
     """
-    access_key = settings.access_key_id or ""
-    access_key_preview = access_key[:8] + "..." if len(access_key) > 8 else access_key
-
-    endpoint = settings.endpoint_url or "https://s3.amazonaws.com"
-    region = settings.region_name or "eu-west-1"
-
-    return S3Context(
-        endpoint=endpoint,
-        access_key_preview=access_key_preview,
-        region=region,
+    return _build_context(
+        settings.endpoint_url or "https://s3.amazonaws.com",
+        settings.access_key_id or "",
+        settings.region_name or "eu-west-1",
     )
 
 
@@ -69,16 +78,10 @@ def extract_s3_context_from_credentials(credentials: dict) -> S3Context:
     Returns:
         S3Context with connection information
     """
-    access_key = str(credentials.get("access_key_id", "")).strip()
-    access_key_preview = access_key[:8] + "..." if len(access_key) > 8 else access_key
-
-    endpoint = credentials.get("endpoint", "") or "https://s3.amazonaws.com"
-    region = credentials.get("region", "eu-west-1")
-
-    return S3Context(
-        endpoint=endpoint,
-        access_key_preview=access_key_preview,
-        region=region,
+    return _build_context(
+        credentials.get("endpoint", "") or "https://s3.amazonaws.com",
+        str(credentials.get("access_key_id", "")).strip(),
+        credentials.get("region", "eu-west-1"),
     )
 
 
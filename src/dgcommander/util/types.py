@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from ..sdk import FileMetadata, UploadSummary
 from ..shared.object_sort_order import ObjectSortOrder
+from .json import dumps_json
 
 
 @dataclass(slots=True)
@@ -23,7 +24,7 @@ class BucketStats:
     object_count_is_limited: bool = False
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ObjectItem:
     key: str
     original_bytes: int
@@ -43,20 +44,46 @@ class ObjectItem:
 
 @dataclass(slots=True)
 class ObjectList:
-    objects: list[ObjectItem]
-    common_prefixes: list[str]
+    """One page of an object listing.
+
+    The catalog caches pages and hands the same instance to every repeat request, so
+    the items and prefixes are immutable tuples; cached instances must not be mutated,
+    or their memoized JSON body goes stale.
+    """
+
+    objects: tuple[ObjectItem, ...]
+    common_prefixes: tuple[str, ...]
     cursor: str | None = None
     limited: bool = False
+    # Encoded body, kept once computed: cached pages are handed to every repeat request.
+    _json: bytes | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         data = {
             "objects": [item.to_dict() for item in self.objects],
-            "common_prefixes": self.common_prefixes,
+            "common_prefixes": list(self.common_prefixes),
         }
         if self.cursor:
             data["cursor"] = self.cursor
         return data
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize in the ``ObjectListResponse`` shape without building a dict per item.
+
+        ``ObjectItem`` is a slotted dataclass whose fields match the response contract, so
+        orjson encodes each item directly.
+        """
+        if self._json is None:
+            self._json = dumps_json(
+                {
+                    "objects": self.objects,
+                    "common_prefixes": self.common_prefixes,
+                    "cursor": self.cursor,
+                    "limited": self.limited,
+                }
+            )
+        return self._json
+
 
 @dataclass(slots=True)
 class PresignedUrlResponse:
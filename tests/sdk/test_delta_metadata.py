@@ -50,3 +50,48 @@ def test_resolver_returns_empty_metadata_when_all_candidates_fail():
     assert result.physical_key is None
     assert result.original_bytes is None
     assert result.stored_bytes is None
+
+
+def test_resolver_caches_resolutions_until_bucket_invalidated():
+    found = {"Metadata": {"deltaglider-original-size": "1024"}, "ContentLength": 512}
+    client = make_client(found, found)
+    resolver = DeltaMetadataResolver(client)
+
+    first = resolver.resolve("bucket", "path/file.txt")
+    second = resolver.resolve("bucket", "/path/file.txt")
+
+    assert second is first
+    assert client.calls == [("bucket", "path/file.txt.delta")]
+
+    resolver.invalidate_bucket("bucket")
+    resolver.resolve("bucket", "path/file.txt")
+    assert len(client.calls) == 2
+
+
+def test_resolver_misses_are_not_cached_across_adapters():
+    missing = ClientError({"Error": {"Code": "NoSuchKey"}}, "HeadObject")
+    found = {"Metadata": {"deltaglider-original-size": "1024"}, "ContentLength": 512}
+    client = make_client(missing, missing, found)
+    # Each session's adapter owns a resolver; only the writer's gets invalidated.
+    reader = DeltaMetadataResolver(client)
+    writer = DeltaMetadataResolver(client)
+
+    assert reader.resolve("bucket", "path/file.txt").physical_key is None
+    writer.invalidate_bucket("bucket")
+
+    result = reader.resolve("bucket", "path/file.txt")
+    assert result.physical_key == "path/file.txt.delta"
+    assert result.original_bytes == 1024
+
+
+def test_resolver_rewritten_object_misses_the_cache():
+    old = {"Metadata": {"deltaglider-original-size": "1024"}, "ContentLength": 512}
+    new = {"Metadata": {"deltaglider-original-size": "2048"}, "ContentLength": 700}
+    client = make_client(old, new)
+    resolver = DeltaMetadataResolver(client)
+
+    assert resolver.resolve("bucket", "app.zip", version=(512, "t1")).original_bytes == 1024
+    assert resolver.resolve("bucket", "app.zip", version=(512, "t1")).original_bytes == 1024
+    # Another session rewrote the object; the listing shows a new size and timestamp.
+    assert resolver.resolve("bucket", "app.zip", version=(700, "t2")).original_bytes == 2048
+    assert len(client.calls) == 2
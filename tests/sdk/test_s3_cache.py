@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import sys
+import time
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
@@ -8,63 +10,112 @@ import pytest
 
 from dgcommander.sdk.adapters.s3 import S3DeltaGliderSDK, S3Settings
 
+# Interned so the fake's metadata dicts and lookups share one key object per name
+_K_SIZE = sys.intern("deltaglider-original-size")
+_K_DELTA = sys.intern("deltaglider-is-delta")
+_K_RATIO = sys.intern("deltaglider-compression-ratio")
+
 
 class FakeBotoClient:
     def __init__(self, bucket_names: list[str]):
+        # Shared with FakeDeltaClient, which creates and deletes buckets behind our back,
+        # so the cached response is validated against a snapshot of the names.
         self.bucket_names = bucket_names
+        self._buckets_cache: tuple[tuple[str, ...], dict] | None = None
 
     def list_buckets(self):
-        return {"Buckets": [{"Name": name} for name in self.bucket_names]}
+        names = tuple(self.bucket_names)
+        if self._buckets_cache is not None and self._buckets_cache[0] == names:
+            return self._buckets_cache[1]
+        response = {"Buckets": [{"Name": name} for name in names]}
+        self._buckets_cache = (names, response)
+        return response
 
 
 class FakeDeltaClient:
     def __init__(self, bucket_names: list[str]):
         self.bucket_names = bucket_names
-        self.objects: dict[str, list[dict]] = {name: [] for name in bucket_names}
+        # Membership index for bucket_names; the list is kept for deterministic ordering
+        self._bucket_set = set(bucket_names)
+        # bucket -> key -> entry, so puts and deletes are hashed lookups rather than scans
+        self.objects: dict[str, dict[str, dict]] = {name: {} for name in bucket_names}
+        # Running per-bucket aggregates maintained on every mutation, read by get_bucket_stats
+        self.totals: dict[str, dict[str, int]] = {name: self._empty_totals() for name in bucket_names}
+        # Built Contents per bucket and prefix, dropped whenever that bucket is mutated
+        self._list_cache: dict[str, dict[str, list[dict]]] = {name: {} for name in bucket_names}
+        # (perf_counter reading, LastModified) reused by puts landing within the same millisecond
+        self._last_now: tuple[float, datetime] | None = None
         self.stats_calls: list[tuple[str, bool]] = []
+        self.list_buckets_calls = 0
 
     def create_bucket(self, Bucket: str, CreateBucketConfiguration: dict | None = None):
-        if Bucket not in self.bucket_names:
+        if Bucket not in self._bucket_set:
+            self._bucket_set.add(Bucket)
             self.bucket_names.append(Bucket)
-            self.objects[Bucket] = []
+            self.objects[Bucket] = {}
+            self.totals[Bucket] = self._empty_totals()
+            self._list_cache[Bucket] = {}
 
     def delete_bucket(self, Bucket: str):
-        if Bucket in self.bucket_names:
+        if Bucket in self._bucket_set:
+            self._bucket_set.discard(Bucket)
             self.bucket_names.remove(Bucket)
             self.objects.pop(Bucket, None)
+            self.totals.pop(Bucket, None)
+            self._list_cache.pop(Bucket, None)
 
     def list_buckets(self):
+        self.list_buckets_calls += 1
         return {"Buckets": [{"Name": name} for name in self.bucket_names]}
 
     def put_object(self, Bucket: str, Key: str, Body: bytes):
-        now = datetime.now(UTC).isoformat()
+        now = self._now()
         entry = {
             "Key": Key,
             "Size": len(Body),
             "Original": len(Body),
             "LastModified": now,
             "Metadata": {
-                "deltaglider-original-size": str(len(Body)),
-                "deltaglider-is-delta": "false",
-                "deltaglider-compression-ratio": "0.0",
+                _K_SIZE: str(len(Body)),
+                _K_DELTA: "false",
+                _K_RATIO: "0.0",
             },
         }
-        bucket_objects = self.objects.setdefault(Bucket, [])
-        for idx, existing in enumerate(bucket_objects):
-            if existing["Key"] == Key:
-                bucket_objects[idx] = entry
-                break
-        else:
-            bucket_objects.append(entry)
+        bucket_objects = self.objects.setdefault(Bucket, {})
+        self._account(Bucket, bucket_objects.get(Key), -1)
+        bucket_objects[Key] = entry
+        self._account(Bucket, entry, 1)
 
     def delete_object(self, Bucket: str, Key: str):
-        bucket_objects = self.objects.get(Bucket, [])
-        self.objects[Bucket] = [obj for obj in bucket_objects if obj["Key"] != Key]
+        self._account(Bucket, self.objects.get(Bucket, {}).pop(Key, None), -1)
 
     def delete_objects(self, Bucket: str, Delete: dict):
-        keys = {item["Key"] for item in Delete.get("Objects", [])}
-        bucket_objects = self.objects.get(Bucket, [])
-        self.objects[Bucket] = [obj for obj in bucket_objects if obj["Key"] not in keys]
+        bucket_objects = self.objects.get(Bucket, {})
+        for item in Delete.get("Objects", []):
+            self._account(Bucket, bucket_objects.pop(item["Key"], None), -1)
+
+    def _now(self) -> datetime:
+        tick = time.perf_counter()
+        if self._last_now is not None and tick - self._last_now[0] < 0.001:
+            return self._last_now[1]
+        now = datetime.now(UTC)
+        self._last_now = (tick, now)
+        return now
+
+    @staticmethod
+    def _empty_totals() -> dict[str, int]:
+        return {"total": 0, "stored": 0, "delta_count": 0, "object_count": 0}
+
+    def _account(self, bucket: str, entry: dict | None, sign: int) -> None:
+        if entry is None:
+            return
+        self._list_cache.pop(bucket, None)
+        totals = self.totals.setdefault(bucket, self._empty_totals())
+        metadata = entry["Metadata"]
+        totals["total"] += sign * int(metadata[_K_SIZE])
+        totals["stored"] += sign * entry["Size"]
+        totals["delta_count"] += sign * (metadata[_K_DELTA] == "true")
+        totals["object_count"] += sign
 
     def list_objects(
         self,
@@ -75,18 +126,22 @@ class FakeDeltaClient:
         FetchMetadata: bool = False,
         **_: object,
     ) -> dict:
-        contents = []
-        for obj in self.objects.get(Bucket, []):
-            if Prefix and not obj["Key"].startswith(Prefix):
-                continue
-            contents.append(
-                {
-                    "Key": obj["Key"],
-                    "Size": obj["Size"],
-                    "LastModified": obj["LastModified"],
-                    "Metadata": obj["Metadata"],
-                }
-            )
+        # The fake ignores MaxKeys/Delimiter (one untruncated page, no common prefixes), so
+        # the built contents depend only on the bucket and prefix.
+        cached = self._list_cache.setdefault(Bucket, {}).get(Prefix)
+        if cached is not None:
+            return {"Contents": cached, "IsTruncated": False, "CommonPrefixes": []}
+        contents = [
+            {
+                "Key": obj["Key"],
+                "Size": obj["Size"],
+                "LastModified": obj["LastModified"],
+                "Metadata": obj["Metadata"],
+            }
+            for obj in self.objects.get(Bucket, {}).values()
+            if not Prefix or obj["Key"].startswith(Prefix)
+        ]
+        self._list_cache[Bucket][Prefix] = contents
         return {"Contents": contents, "IsTruncated": False, "CommonPrefixes": []}
 
     def get_object(self, Bucket: str, Key: str):  # pragma: no cover - not used but kept for completeness
@@ -101,13 +156,13 @@ class FakeDeltaClient:
     ):
         # Track calls for test assertions (using simplified signature for backwards compat)
         self.stats_calls.append((bucket, mode, use_cache, refresh_cache))
-        objects = self.objects.get(bucket, [])
-        total_size = sum(int(obj["Metadata"]["deltaglider-original-size"]) for obj in objects)
-        stored_size = sum(obj["Size"] for obj in objects)
-        object_count = len(objects)
+        totals = self.totals.get(bucket) or self._empty_totals()
+        total_size = totals["total"]
+        stored_size = totals["stored"]
+        object_count = totals["object_count"]
         space_saved = total_size - stored_size
         avg_ratio = (space_saved / total_size) if total_size else 0.0
-        delta_count = sum(1 for obj in objects if obj["Metadata"]["deltaglider-is-delta"] == "true")
+        delta_count = totals["delta_count"]
         return SimpleNamespace(
             bucket=bucket,
             object_count=object_count,
@@ -120,22 +175,9 @@ class FakeDeltaClient:
         )
 
 
-@pytest.fixture
-def fake_environment(monkeypatch):
-    bucket_names: list[str] = ["alpha"]
-    fake_dg = FakeDeltaClient(bucket_names)
-    fake_boto = FakeBotoClient(bucket_names)
-
-    monkeypatch.setattr("boto3.client", lambda *args, **kwargs: fake_boto)
-
-    class DummyConfig:
-        def __init__(self, **_: object):
-            pass
-
-    monkeypatch.setattr("boto3.session.Config", DummyConfig)
-
-    # Ensure deltaglider.client is importable even without cffi/cryptography
-    import sys
+@pytest.fixture(scope="session")
+def _dg_module_stub():
+    """Ensure deltaglider.client is importable even without cffi/cryptography (once per run)."""
     from types import ModuleType
 
     if "deltaglider" not in sys.modules:
@@ -144,7 +186,30 @@ def fake_environment(monkeypatch):
         deltaglider_mod.client = client_mod  # type: ignore[attr-defined]
         sys.modules["deltaglider"] = deltaglider_mod
         sys.modules["deltaglider.client"] = client_mod
-    sys.modules["deltaglider.client"].create_client = lambda **kwargs: fake_dg  # type: ignore[attr-defined]
+    return sys.modules["deltaglider.client"]
+
+
+class DummyConfig:
+    def __init__(self, **_: object):
+        pass
+
+
+@pytest.fixture(scope="module")
+def _boto_module_stubs():
+    """Patch the boto3 pieces that are identical for every test in this module once."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("boto3.session.Config", DummyConfig)
+        yield mp
+
+
+@pytest.fixture
+def fake_environment(monkeypatch, _dg_module_stub, _boto_module_stubs):
+    bucket_names: list[str] = ["alpha"]
+    fake_dg = FakeDeltaClient(bucket_names)
+    fake_boto = FakeBotoClient(bucket_names)
+
+    monkeypatch.setattr("boto3.client", lambda *args, **kwargs: fake_boto)
+    monkeypatch.setattr(_dg_module_stub, "create_client", lambda **kwargs: fake_dg, raising=False)
 
     return fake_dg
 
@@ -199,7 +264,81 @@ def test_upload_refreshes_bucket_cache(fake_environment):
     # Now explicitly compute stats to verify objects are there
     snapshot = sdk.compute_bucket_stats("alpha")
     assert snapshot.object_count == len(fake_dg.objects["alpha"])
-    assert snapshot.original_bytes == sum(
-        int(obj["Metadata"]["deltaglider-original-size"]) for obj in fake_dg.objects["alpha"]
-    )
+    assert snapshot.original_bytes == sum(int(obj["Metadata"][_K_SIZE]) for obj in fake_dg.objects["alpha"].values())
     assert snapshot.computed_at is not None
+
+
+def test_bucket_exists_reuses_recent_bucket_listing(fake_environment):
+    fake_dg = fake_environment
+    sdk = S3DeltaGliderSDK(S3Settings())
+
+    assert sdk.bucket_exists("alpha") is True
+    assert sdk.bucket_exists("alpha") is True
+    assert fake_dg.list_buckets_calls == 1
+
+    # Unknown names always go back to S3 so externally created buckets are found
+    fake_dg.create_bucket(Bucket="beta")
+    assert sdk.bucket_exists("beta") is True
+    assert fake_dg.list_buckets_calls == 2
+
+    sdk.delete_bucket("beta")
+    assert sdk.bucket_exists("beta") is False
+    sdk.create_bucket("gamma")
+    assert sdk.bucket_exists("gamma") is True
+    assert fake_dg.list_buckets_calls == 2
+
+    # A miss reported by S3 is remembered briefly
+    assert sdk.bucket_exists("missing") is False
+    assert sdk.bucket_exists("missing") is False
+    assert fake_dg.list_buckets_calls == 3
+    sdk.create_bucket("missing")
+    assert sdk.bucket_exists("missing") is True
+
+
+@pytest.mark.parametrize(("flag", "expected"), [("true", True), ("TRUE", True), ("false", False), (None, False)])
+def test_listing_entry_delta_flag(fake_environment, flag, expected):
+    sdk = S3DeltaGliderSDK(S3Settings())
+    metadata = {_K_SIZE: "100"}
+    if flag is not None:
+        metadata[_K_DELTA] = flag
+    item = {"Key": "foo.bin", "Size": 40, "LastModified": datetime(2024, 1, 1, tzinfo=UTC), "Metadata": metadata}
+
+    logical = sdk._logical_object_from_listing("alpha", item, quick_mode=True)
+
+    assert logical.compressed is expected
+    assert logical.original_bytes == 100
+
+
+def test_extend_listing_response_converts_every_entry(fake_environment):
+    sdk = S3DeltaGliderSDK(S3Settings())
+    modified = datetime(2024, 1, 1, tzinfo=UTC)
+    response = {
+        "Contents": [
+            {"Key": "app.zip", "Size": 40, "LastModified": modified, "Metadata": {_K_DELTA: "true", _K_SIZE: "100"}},
+            {"Key": "readme.txt", "Size": 12, "LastModified": modified, "Metadata": {}},
+        ],
+        "CommonPrefixes": [{"Prefix": "docs/"}],
+    }
+    objects: list = []
+    prefixes: set[str] = set()
+
+    sdk._extend_listing_response("alpha", response, objects, prefixes, "", quick_mode=True)
+
+    assert [(obj.key, obj.physical_key, obj.compressed) for obj in objects] == [
+        ("app.zip", "app.zip.delta", True),
+        ("readme.txt", "readme.txt", False),
+    ]
+    assert [obj.original_bytes for obj in objects] == [100, 12]
+    assert prefixes == {"docs/"}
+
+
+def test_string_timestamps_parse_to_utc(fake_environment):
+    sdk = S3DeltaGliderSDK(S3Settings())
+    item = {"Key": "a.txt", "Size": 1, "LastModified": "2024-01-01T12:00:00+02:00", "Metadata": {}}
+
+    first = sdk._logical_object_from_listing("alpha", item, quick_mode=True)
+    second = sdk._logical_object_from_listing("alpha", dict(item, Key="b.txt"), quick_mode=True)
+
+    assert first.modified == datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+    assert first.modified.tzinfo is UTC
+    assert second.modified is first.modified
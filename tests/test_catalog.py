@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 
 import pytest
@@ -13,6 +15,7 @@ from dgcommander.services.catalog import (
     ObjectMutationService,
     _CatalogCacheManager,
     _clamp_savings_pct,
+    _filter_and_select,
     _filter_and_sort,
 )
 from dgcommander.services.deltaglider import (
@@ -22,7 +25,7 @@ from dgcommander.services.deltaglider import (
     StatsMode,
 )
 from dgcommander.services.list_cache import ListObjectsCache
-from dgcommander.util.types import ObjectSortOrder
+from dgcommander.util.types import ObjectItem, ObjectList, ObjectSortOrder
 
 
 @pytest.fixture
@@ -174,6 +177,26 @@ class TestFilterAndSort:
         result = _filter_and_sort(objs, ObjectSortOrder.name_asc, compressed=None, search_key="zzz")
         assert result == []
 
+    @pytest.mark.parametrize("sort_order", list(ObjectSortOrder))
+    def test_select_window_matches_full_sort(self, now, sort_order):
+        objs = [
+            LogicalObject(
+                key=f"k{i:03d}",
+                original_bytes=i % 7,
+                stored_bytes=1,
+                compressed=bool(i % 2),
+                modified=now.replace(minute=i % 5),
+                physical_key=f"k{i:03d}",
+            )
+            for i in range(100)
+        ]
+        expected = _filter_and_sort(objs, sort_order, compressed=True, search_key=None)
+
+        window, total = _filter_and_select(objs, sort_order, compressed=True, search_key=None, window=5)
+
+        assert total == len(expected)
+        assert window == expected[:5]
+
 
 # ── CatalogCacheManager tests ──────────────────────────────────────
 
@@ -333,6 +356,69 @@ class TestObjectListingService:
         sizes = [o.original_bytes for o in result.objects]
         assert sizes == sorted(sizes, reverse=True)
 
+    def test_filtered_variants_reuse_sorted_index(self, sdk, list_cache):
+        cache_mgr = _CatalogCacheManager(sdk=sdk, list_cache=list_cache)
+        svc = ObjectListingService(sdk=sdk, list_cache=list_cache, cache_manager=cache_mgr)
+
+        result = svc.list_objects(
+            bucket="test-bucket",
+            prefix="",
+            limit=50,
+            cursor=None,
+            sort_order=ObjectSortOrder.size_desc,
+            compressed=None,
+            search="data",
+            credentials_key="cred1",
+        )
+        assert [o.key for o in result.objects] == ["data/archive.zip", "data/small.csv"]
+
+        # The unfiltered sort was stored too, so the next filter is served from it
+        lookup = list_cache.get_variant("cred1", "test-bucket", "", "size_desc", True, None)
+        assert lookup is not None and lookup.variant is None
+        sizes = [o.original_bytes for o in lookup.sorted_index]
+        assert sizes == sorted(sizes, reverse=True) and len(sizes) == 3
+
+        result = svc.list_objects(
+            bucket="test-bucket",
+            prefix="",
+            limit=50,
+            cursor=None,
+            sort_order=ObjectSortOrder.size_desc,
+            compressed=True,
+            credentials_key="cred1",
+        )
+        assert [o.key for o in result.objects] == [o.key for o in lookup.sorted_index if o.compressed]
+
+    def test_repeat_page_request_reuses_rendered_page(self, sdk, list_cache):
+        cache_mgr = _CatalogCacheManager(sdk=sdk, list_cache=list_cache)
+        svc = ObjectListingService(sdk=sdk, list_cache=list_cache, cache_manager=cache_mgr)
+        kwargs = dict(
+            bucket="test-bucket",
+            prefix="",
+            limit=2,
+            cursor=None,
+            sort_order=ObjectSortOrder.name_asc,
+            compressed=None,
+            credentials_key="cred1",
+        )
+
+        first = svc.list_objects(**kwargs)
+        body = first.to_json_bytes()
+        second = svc.list_objects(**kwargs)
+        assert second is first
+        assert second.to_json_bytes() is body
+        assert list_cache.stats()["hits"] == 1
+        # The shared page cannot be changed under later requests.
+        assert isinstance(second.objects, tuple)
+        with pytest.raises(FrozenInstanceError):
+            second.objects[0].key = "renamed"  # type: ignore[misc]
+
+        next_page = svc.list_objects(**{**kwargs, "cursor": first.cursor})
+        assert next_page is not first
+
+        cache_mgr.invalidate_listing("test-bucket")
+        assert svc.list_objects(**kwargs) is not first
+
     def test_bypass_cache_invalidates(self, sdk, list_cache):
         cache_mgr = _CatalogCacheManager(sdk=sdk, list_cache=list_cache)
         svc = ObjectListingService(sdk=sdk, list_cache=list_cache, cache_manager=cache_mgr)
@@ -391,3 +477,15 @@ class TestObjectMutationService:
         )
         keys = [o.key for o in result.objects]
         assert "docs/readme.txt" not in keys
+
+
+def test_object_item_dict_and_json_bytes_agree_on_timestamps():
+    item = ObjectItem(
+        key="a.txt", original_bytes=1, stored_bytes=1, compressed=False, modified=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    as_dict = item.to_dict()
+    assert as_dict["modified"] == "2024-01-01T00:00:00Z"
+    json.dumps(as_dict)  # stays serializable without orjson
+
+    encoded = json.loads(ObjectList(objects=(item,), common_prefixes=()).to_json_bytes())
+    assert encoded["objects"] == [as_dict]
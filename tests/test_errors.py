@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from dgcommander.util.errors import NotFoundError, RateLimitExceeded, SDKError
+
+
+def test_error_response_without_details_reuses_encoded_body(app):
+    with app.app_context():
+        first = RateLimitExceeded().to_response()
+        second = RateLimitExceeded().to_response()
+    assert first.status_code == 429
+    assert json.loads(first.get_data()) == {"error": {"code": "throttled", "message": "Rate limit exceeded"}}
+    assert first.get_data() == second.get_data()
+    assert first.headers["Content-Length"] == str(len(first.get_data()))
+
+
+def test_error_response_includes_details(app):
+    with app.app_context():
+        response = SDKError("boom", details={"s3_region": "eu-west-1"}).to_response()
+    assert response.status_code == 503
+    assert json.loads(response.get_data())["error"]["details"] == {"s3_region": "eu-west-1"}
+
+
+def test_not_found_handler(client):
+    response = client.get("/api/does-not-exist")
+    assert response.status_code == 404
+    assert response.get_json()["error"]["code"] == "not_found"
+    assert NotFoundError("bucket", "bucket_not_found").to_dict()["error"]["message"] == "bucket not found"
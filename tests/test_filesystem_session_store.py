@@ -136,6 +136,65 @@ def test_lru_eviction(store, mock_sdk):
     assert store.get(session_ids[1]) is not None  # Others still exist
 
 
+def test_get_refreshes_lru_order(store, mock_sdk):
+    """Reading an older session moves it to the MRU end so it survives eviction."""
+    session_ids = []
+    for i in range(5):
+        creds = {"access_key_id": f"key_{i}", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+        session_id, _ = store.create_or_reuse(creds, mock_sdk)
+        session_ids.append(session_id)
+
+    assert store.get(session_ids[0]) is not None
+    assert store.get(session_ids[0]) is not None  # already MRU: index left untouched
+
+    creds_6 = {"access_key_id": "key_6", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+    store.create_or_reuse(creds_6, mock_sdk)
+
+    assert store.get(session_ids[0]) is not None
+    assert store.get(session_ids[1]) is None
+
+
+def test_credential_lookup_does_not_rebuild_sdk_clients(mock_sdk, temp_session_dir):
+    """Matching credentials only unpickles session records; SDKs are built for the hit alone."""
+    factory_calls = []
+
+    def factory(credentials):
+        factory_calls.append(credentials["access_key_id"])
+        return mock_sdk
+
+    store = FileSystemSessionStore(max_size=5, ttl_seconds=60, session_dir=temp_session_dir, sdk_factory=factory)
+    for i in range(3):
+        creds = {"access_key_id": f"key_{i}", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+        store.create_or_reuse(creds, mock_sdk)
+
+    reused = {"access_key_id": "key_2", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+    store.create_or_reuse(reused, mock_sdk)
+    store.cleanup_expired()
+
+    assert factory_calls == ["key_2"]
+
+
+def test_failed_sdk_rebuild_drops_dead_session(mock_sdk, temp_session_dir):
+    """A session whose SDK cannot be rebuilt leaves the index instead of evicting a live one."""
+
+    def factory(credentials):
+        if credentials["access_key_id"] == "broken":
+            raise RuntimeError("cannot build SDK")
+        return mock_sdk
+
+    store = FileSystemSessionStore(max_size=2, ttl_seconds=60, session_dir=temp_session_dir, sdk_factory=factory)
+    live = {"access_key_id": "live", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+    broken = {"access_key_id": "broken", "secret_access_key": "secret", "region": "us-east-1", "endpoint": ""}
+    live_id, _ = store.create_or_reuse(live, mock_sdk)
+    broken_id, _ = store.create_or_reuse(broken, mock_sdk)
+
+    new_id, _ = store.create_or_reuse(broken, mock_sdk)
+
+    assert new_id != broken_id
+    assert store._read_index() == [live_id, new_id]
+    assert store.get(live_id) is not None
+
+
 def test_cleanup_expired(credentials, mock_sdk, mock_sdk_factory, temp_session_dir):
     """Test cleanup of expired sessions."""
     # Create store with 1 second TTL
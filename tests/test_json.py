@@ -0,0 +1,17 @@
+"""Tests for the JSON helpers and the orjson-backed Flask provider."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from flask import jsonify
+
+
+def test_json_provider_matches_flask_defaults(app):
+    """jsonify goes through orjson but keeps Flask's date and key-ordering conventions."""
+    with app.app_context():
+        response = jsonify({"b": 1, "a": datetime(2024, 1, 1, tzinfo=UTC)})
+    assert response.get_data() == b'{"a":"Mon, 01 Jan 2024 00:00:00 GMT","b":1}\n'
+    assert app.json.loads(b'{"ok": true}') == {"ok": True}
+    assert app.json.loads('{"n": 1.5}', parse_float=str) == {"n": "1.5"}
+    assert type(response) is app.response_class
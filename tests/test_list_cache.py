@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 import pytest
 
 from dgcommander.services.deltaglider import BucketSnapshot, InMemoryDeltaGliderSDK, LogicalObject
-from dgcommander.services.list_cache import ListObjectsCache
+from dgcommander.services.list_cache import FastTTLDict, ListObjectsCache, make_credentials_cache_key
 
 
 @pytest.fixture()
@@ -288,6 +288,17 @@ def test_cache_credentials_isolation():
     assert cache.stats()["cached_entries"] == 2  # Two separate cache entries
 
 
+def test_credentials_cache_key_ignores_secret():
+    """The derived key depends on endpoint, access key and region only."""
+    base = {"endpoint": "https://s3.example", "access_key_id": "AKIA1", "region": "eu-west-1"}
+
+    key = make_credentials_cache_key({**base, "secret_access_key": "one"})
+
+    assert key == make_credentials_cache_key({**base, "secret_access_key": "two"})
+    assert key != make_credentials_cache_key({**base, "access_key_id": "AKIA2"})
+    assert make_credentials_cache_key(None) == "no-credentials"
+
+
 def test_list_cache_stats():
     """Test cache statistics tracking."""
     cache = ListObjectsCache(ttl_seconds=30, max_size=100)
@@ -325,3 +336,99 @@ def test_list_cache_stats():
     assert stats["hits"] == 1
     assert stats["misses"] == 1
     assert stats["hit_rate_percent"] == 50.0
+
+
+def test_invalidate_keys_keeps_unrelated_prefixes():
+    """Changing an object drops only the listings whose prefix contains its key."""
+    cache = ListObjectsCache(ttl_seconds=30, max_size=100)
+    credentials_key = "test-credentials-789"
+
+    for prefix in ("", "data", "data/", "/data/", "data/nested/", "logs/", "/logs/"):
+        cache.prime_listing(credentials_key, "bucket", prefix, [], [])
+    cache.prime_listing(credentials_key, "other", "", [], [])
+
+    cache.invalidate_keys("bucket", ["/data/a.txt"])
+
+    assert cache.get_listing(credentials_key, "bucket", "/logs/") is not None
+    for prefix in ("", "data", "data/", "/data/"):
+        assert cache.get_listing(credentials_key, "bucket", prefix) is None
+    assert cache.get_listing(credentials_key, "bucket", "data/nested/") is not None
+    assert cache.get_listing(credentials_key, "bucket", "logs/") is not None
+    assert cache.get_listing(credentials_key, "other", "") is not None
+
+
+def test_evicted_entries_leave_the_prefix_index():
+    """Entries the cache drops by itself are forgotten by the bucket and prefix indexes."""
+    cache = ListObjectsCache(ttl_seconds=30, max_size=4)
+    credentials_key = "test-credentials-789"
+
+    for index in range(10):
+        cache.prime_listing(credentials_key, "bucket", f"dir{index}/", [], [])
+
+    assert len(cache._bucket_index["bucket"]) == cache.stats()["cached_entries"]
+    assert len(cache._prefix_by_bucket["bucket"]) == cache.stats()["cached_entries"]
+
+
+def test_single_entry_cache_keeps_latest_listing():
+    """With max_size=1 the newest listing survives and the indexes track only it."""
+    cache = ListObjectsCache(ttl_seconds=30, max_size=1)
+    credentials_key = "test-credentials-789"
+
+    cache.prime_listing(credentials_key, "bucket", "p/", [], [])
+    cache.prime_listing(credentials_key, "bucket", "q/", [], [])
+
+    assert cache.get_listing(credentials_key, "bucket", "p/") is None
+    assert cache.get_listing(credentials_key, "bucket", "q/") is not None
+    assert cache._bucket_index["bucket"] == {(credentials_key, "bucket", "q/")}
+    assert cache._prefix_by_bucket["bucket"] == ["q/"]
+
+
+def test_zero_ttl_listing_is_not_indexed():
+    """A listing that expires on insert leaves nothing behind in the indexes."""
+    cache = ListObjectsCache(ttl_seconds=0, max_size=4)
+    credentials_key = "test-credentials-789"
+
+    cache.prime_listing(credentials_key, "bucket", "p/", [], [])
+
+    assert cache.get_listing(credentials_key, "bucket", "p/") is None
+    assert cache._bucket_index == {}
+    assert cache._prefix_index == {}
+    assert cache._prefix_by_bucket == {}
+
+
+def test_fast_ttl_dict_expires_and_evicts_least_recently_used():
+    """FastTTLDict drops expired entries and trims to the most recently read half when full."""
+    clock = [0.0]
+    ttl_dict = FastTTLDict(maxsize=4, ttl=10, timer=lambda: clock[0])
+
+    for key in ("a", "b", "c", "d"):
+        ttl_dict[key] = key.upper()
+    assert ttl_dict.get("a") == "A"
+    assert ttl_dict.get("b") == "B"
+
+    ttl_dict["e"] = "E"
+    assert len(ttl_dict) == 2
+    assert ttl_dict.get("e") == "E"
+    assert ttl_dict.get("b") == "B"
+    assert ttl_dict.get("c") is None
+
+    clock[0] = 10.5
+    assert ttl_dict.get("b") is None
+    assert ttl_dict.pop("e", "missing") == "E"
+    assert ttl_dict.pop("e", "missing") == "missing"
+
+
+def test_store_variant_returns_shared_tuple():
+    """store_variant returns the same tuple later hits return."""
+    cache = ListObjectsCache(ttl_seconds=30, max_size=100)
+    credentials_key = "test-credentials-variant"
+
+    assert cache.store_variant(credentials_key, "bucket", "", "name_asc", None, None, []) is None
+
+    cache.prime_listing(credentials_key, "bucket", "", [], ["docs/"])
+    stored = cache.store_variant(credentials_key, "bucket", "", "name_asc", None, None, [])
+    assert stored is not None
+
+    lookup = cache.get_variant(credentials_key, "bucket", "", "name_asc", None, None)
+    assert lookup is not None
+    assert lookup.variant is stored
@@ -157,3 +157,25 @@ def test_delete_objects_updates_savings_percentage(memory_sdk):
     assert buckets[0].original_bytes == 100
     assert buckets[0].stored_bytes == 10
     assert buckets[0].savings_pct == 90.0  # (1 - 10/100) * 100
+
+
+def test_list_objects_returns_independent_listings(memory_sdk):
+    """Test that mutating one listing result does not affect later listings."""
+    first = memory_sdk.list_objects("test-bucket", "")
+    first.objects.clear()
+    first.common_prefixes.append("bogus/")
+
+    listing = memory_sdk.list_objects("test-bucket", "")
+    assert len(listing.objects) == 3
+    assert "bogus/" not in listing.common_prefixes
+
+
+def test_delete_object_removes_blob(memory_sdk):
+    """Test that delete_object drops the object and its stored bytes."""
+    memory_sdk.delete_object("test-bucket", "/file2.txt")
+
+    assert [obj.key for obj in memory_sdk.list_objects("test-bucket", "").objects] == ["file1.txt", "file3.txt"]
+    with pytest.raises(FileNotFoundError):
+        memory_sdk.open_object_stream("test-bucket", "file2.txt")
+    with pytest.raises(KeyError):
+        memory_sdk.delete_object("test-bucket", "file2.txt")
@@ -0,0 +1,24 @@
+"""Tests for ObjectSortOrder query parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from dgcommander.shared.object_sort_order import ObjectSortOrder
+
+
+@pytest.mark.parametrize(
+    ("sort", "direction", "expected"),
+    [
+        (None, None, ObjectSortOrder.modified_desc),
+        ("name", "asc", ObjectSortOrder.name_asc),
+        ("KEY", None, ObjectSortOrder.name_desc),
+        ("size", "ASC", ObjectSortOrder.size_asc),
+        ("original_bytes", "desc", ObjectSortOrder.size_desc),
+        ("modified", "asc", ObjectSortOrder.modified_asc),
+        ("modified", "sideways", ObjectSortOrder.modified_asc),
+        ("unknown", "asc", ObjectSortOrder.modified_desc),
+    ],
+)
+def test_from_query(sort, direction, expected):
+    assert ObjectSortOrder.from_query(sort, direction) is expected
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from dgcommander.contracts.objects import ObjectListResponse
 from dgcommander.services.deltaglider import (
     BucketSnapshot,
     InMemoryDeltaGliderSDK,
@@ -226,12 +227,28 @@ def test_list_objects_pagination(client):
     assert payload_2["objects"][0]["key"].endswith("notes.txt")
 
 
+def test_list_objects_response_shape(client):
+    response = client.get("/api/objects/", query_string={"bucket": "releases", "prefix": "releases/"})
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == str(len(response.data))
+    payload = response.get_json()
+    assert set(payload) == {"objects", "common_prefixes", "cursor", "limited"}
+    assert payload["cursor"] is None
+    assert payload["limited"] is False
+    item = payload["objects"][0]
+    assert set(item) == {"key", "original_bytes", "stored_bytes", "compressed", "modified"}
+    assert item["modified"].endswith("Z")
+    # The route bypasses response_model serialization, so check the contract here.
+    ObjectListResponse.model_validate_json(response.data)
+
+
 def test_object_metadata(client):
     response = client.get("/api/objects/releases/releases/v1.0.0/app.zip/metadata")
     assert response.status_code == 200
     metadata = response.get_json()
     assert metadata["key"].endswith("app.zip")
     assert metadata["accept_ranges"] is False
+    assert metadata["modified"] == "2024-01-01T00:00:00Z"
 
 
 def test_list_objects_unknown_bucket(client):
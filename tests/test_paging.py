@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from dgcommander.util.errors import APIError
+from dgcommander.util.paging import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize("offset", [0, 5, 200, 15000, 2**40])
+def test_cursor_roundtrip(offset):
+    cursor = encode_cursor(offset)
+    assert len(cursor) == 11
+    assert decode_cursor(cursor) == offset
+
+
+@pytest.mark.parametrize("offset", [5, 1200])
+def test_decode_legacy_cursor(offset):
+    legacy = base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode("ascii")
+    assert decode_cursor(legacy) == offset
+
+
+@pytest.mark.parametrize("raw", ["not base64!", base64.urlsafe_b64encode(b"page:3").decode("ascii")])
+def test_decode_invalid_cursor(raw):
+    with pytest.raises(APIError) as excinfo:
+        decode_cursor(raw)
+    assert excinfo.value.code == "invalid_cursor"
+
+
+def test_decode_empty_cursor():
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import io
 
+from werkzeug.datastructures import FileStorage
 
-def _build_file(data: bytes, name: str):
-    return (io.BytesIO(data), name)
+
+def _build_file(data: bytes, name: str) -> FileStorage:
+    return FileStorage(stream=io.BytesIO(data), filename=name)
 
 
 def test_upload_single_file(client):